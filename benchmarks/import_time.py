@@ -0,0 +1,93 @@
+"""Measure the startup cost of choropleth_geojson, the time of a fresh interpreter importing the package and rendering a
+small map, which dominates the renders of short-lived command line and batch workers. Each stage runs in a new
+interpreter, so the imports are cold, and the best of --repeat runs is kept. The stages are
+
+* python: starting an interpreter that imports nothing, for reference.
+* import: import choropleth_geojson.
+* import_pandas: import choropleth_geojson and pandas, the least a caller with a dataframe needs.
+* render: import, build a 100 subregion map with choroplot() and encode it with to_json.
+
+The heavy dependencies (pandas, matplotlib, plotly) that each stage loaded are reported with it. Examples,
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --output import_time.json
+    python benchmarks/import_time.py --profile    #python -X importtime breakdown of the package import
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+benchmarks = os.path.dirname(os.path.abspath(__file__))
+
+heavy = ('numpy', 'pandas', 'matplotlib', 'plotly')
+
+stages = dict(
+    python='pass',
+    import_='import choropleth_geojson',
+    import_pandas='import choropleth_geojson, pandas',
+    render="""
+import choropleth_geojson as cg
+from synthetic import make_dataframe, make_geojson
+cg.to_json(cg.choropleth('apikey', make_dataframe(100), make_geojson(100, 20), 'name').choroplot())
+""")
+
+report = """
+import json, sys
+print(json.dumps([name for name in {!r} if name in sys.modules]))
+"""
+
+def run_stage(code, repeat=5):
+    """Return the best wall time of repeat fresh interpreters running code, and the heavy modules they loaded."""
+    script = 'import sys\nsys.path[:0] = [{!r}, {!r}]\n'.format(root, benchmarks) + code + report.format(heavy)
+    best, modules = None, []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+        modules = json.loads(output.strip().splitlines()[-1])
+    return best, modules
+
+def profile(limit=20):
+    """Print the modules with the largest cumulative import times of the package, from python -X importtime."""
+    script = 'import sys\nsys.path.insert(0, {!r})\nimport choropleth_geojson'.format(root)
+    lines = subprocess.run([sys.executable, '-X', 'importtime', '-c', script], capture_output=True, text=True).stderr.splitlines()
+    entries = []
+    for line in lines:
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            entries.append((int(parts[1]), parts[2].rstrip()))
+    for microseconds, name in sorted(entries, reverse=True)[:limit]:
+        print('{:>10.1f}ms {}'.format(microseconds/1000, name))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='store the results as JSON')
+    parser.add_argument('--profile', action='store_true', help='print the import time breakdown of the package')
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        profile()
+        return 0
+
+    results = {}
+    for name, code in stages.items():
+        name = name.rstrip('_')
+        seconds, modules = run_stage(code, args.repeat)
+        results[name] = dict(seconds=seconds, modules=modules)
+        print('{:<16} {:>8.3f}s  {}'.format(name, seconds, ', '.join(modules) or '-'))
+        sys.stdout.flush()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(dict(python=sys.version.split()[0], results=results), f, indent=1)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
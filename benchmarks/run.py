@@ -0,0 +1,182 @@
+"""Run the benchmarks of choropleth_geojson on synthetic geojson files and store the results as JSON, optionally
+comparing them with the results of an earlier run (e.g. of another version) to find regressions.
+
+Each case is a number of subregions, a number of vertices per ring, a mode and a missing rate of the data. The stages
+that are measured are
+
+* init: choropleth(apikey, df, geojson, glabel).
+* choroplot: the first choroplot() call of the instance, with all the geometry and data processing.
+* choroplot_warm: a second choroplot() call with another title, served from the caches of the instance.
+* serialize: the JSON encoding of the figure by choropleth_geojson.to_json.
+* serialize_plotly: the JSON encoding of the figure by plotly's encoder, for reference.
+
+The wall time of each stage is the best of --repeat runs, its memory is the peak traced by tracemalloc in a separate
+run (tracing slows the code down). Examples,
+
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --features 100 1000 --vertices 10 100 --output after.json --compare before.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import plotly
+from plotly.utils import PlotlyJSONEncoder
+import choropleth_geojson as cg
+from synthetic import make_dataframe, make_geojson
+
+def measure(function, repeat=3, memory=True):
+    """Return the best wall time of repeat calls of function, and the peak memory of one more call traced by
+    tracemalloc (None without memory).
+
+    """
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+def run_case(n_features, n_vertices, mode, missing_rate, multipolygon=0.25, repeat=3, memory=True):
+    """Return the results of one case, a dictionary with the parameters of the case and the seconds and peak bytes of
+    each stage.
+
+    """
+    geojson = make_geojson(n_features, n_vertices, multipolygon)
+    df = make_dataframe(n_features, missing_rate)
+    options = dict(mode=mode)
+
+    def init():
+        return cg.choropleth('apikey', df, geojson, 'name')
+
+    def cold():
+        return init().choroplot(**options)
+
+    plot = init()
+    fig = plot.choroplot(**options)
+
+    def warm():
+        return plot.choroplot(ptitle='warm', **options)
+
+    def serialize():
+        return cg.to_json(fig)
+
+    def serialize_plotly():
+        return json.dumps(fig, cls=PlotlyJSONEncoder)
+
+    stages = {}
+    for name, function in [('init', init), ('choroplot', cold), ('choroplot_warm', warm), ('serialize', serialize), \
+                           ('serialize_plotly', serialize_plotly)]:
+        seconds, peak = measure(function, repeat, memory)
+        stages[name] = dict(seconds=seconds, peak_bytes=peak)
+
+    #the cold choroplot includes the construction of the instance
+    stages['choroplot']['seconds'] = max(stages['choroplot']['seconds'] - stages['init']['seconds'], 0.0)
+
+    return dict(features=n_features, vertices=n_vertices, mode=mode, missing_rate=missing_rate, multipolygon=multipolygon,
+                output_bytes=len(serialize().encode('utf-8')), stages=stages)
+
+def case_name(result):
+    """Return the name of a case, used to match the cases of two runs."""
+    return '{features}x{vertices}-{mode}-{missing_rate}'.format(**result)
+
+def environment():
+    """Return the versions of the code and of its dependencies, stored with the results."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return dict(commit=commit, python=platform.python_version(), platform=platform.platform(),
+                numpy=np.__version__, pandas=pd.__version__, plotly=plotly.__version__)
+
+def compare(results, baseline, threshold=1.2, min_seconds=0.001):
+    """Print the ratio of the wall time of each stage to the baseline and return the list of regressions, the stages
+    that became slower by more than threshold. Stages faster than min_seconds in both runs are too noisy to compare.
+
+    """
+    previous = {case_name(result): result for result in baseline['results']}
+    regressions = []
+    for result in results['results']:
+        name = case_name(result)
+        if name not in previous:
+            continue
+        for stage, record in result['stages'].items():
+            before = previous[name]['stages'].get(stage, {}).get('seconds')
+            if not before or max(before, record['seconds']) < min_seconds:
+                continue
+            ratio = record['seconds']/before
+            flag = ''
+            if ratio > threshold:
+                flag = '  REGRESSION'
+                regressions.append((name, stage, ratio))
+            print('{:<32} {:<16} {:>10.4f}s {:>10.4f}s {:>7.2f}x{}'.format(name, stage, before, record['seconds'], ratio, flag))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--features', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    parser.add_argument('--vertices', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--modes', nargs='+', default=['layers', 'trace'])
+    parser.add_argument('--missing', type=float, nargs='+', default=[0.1])
+    parser.add_argument('--multipolygon', type=float, default=0.25)
+    parser.add_argument('--max-total', type=int, default=2000000,
+                        help='skip the cases with more than this number of vertices in total (features x vertices)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='do not trace the memory of the stages')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', help='the results of an earlier run to compare with')
+    parser.add_argument('--threshold', type=float, default=1.2)
+    parser.add_argument('--min-seconds', type=float, default=0.001)
+    args = parser.parse_args(argv)
+
+    results = dict(environment=environment(), results=[])
+    for n_features in args.features:
+        for n_vertices in args.vertices:
+            if n_features*n_vertices > args.max_total:
+                continue
+            for mode in args.modes:
+                for missing_rate in args.missing:
+                    result = run_case(n_features, n_vertices, mode, missing_rate, args.multipolygon, args.repeat, not args.no_memory)
+                    results['results'].append(result)
+                    print(case_name(result), ', '.join('{} {:.4f}s'.format(stage, record['seconds'])
+                                                       for stage, record in result['stages'].items()))
+                    sys.stdout.flush()
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_seconds)
+        if regressions:
+            print('{} regressions beyond {}x'.format(len(regressions), args.threshold))
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
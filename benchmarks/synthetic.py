@@ -0,0 +1,87 @@
+"""Synthetic geojson files and dataframes for the benchmarks. The subregions tile a regular grid over the map, each
+subregion is a star-shaped ring (so it never intersects itself) inside its grid cell, or two of them side by side for
+a MultiPolygon, with a configurable number of vertices per ring. Everything is generated from a seed, so the same
+arguments always give the same geojson and dataframe.
+"""
+
+import json
+import numpy as np
+import pandas as pd
+
+def make_geojson(n_features, n_vertices, multipolygon=0.25, label='name', seed=0):
+    """Return a geojson FeatureCollection with n_features subregions named 'region<k>' in the property label.
+
+    Parameters
+    ----------
+    n_features : int
+        The number of subregions (features).
+
+    n_vertices : int
+        The number of coordinates of each ring, including the closing coordinate (at least 4).
+
+    multipolygon : float
+        (Default: 0.25)
+        The fraction of the subregions that are MultiPolygons of two rings, the others are Polygons of one ring.
+
+    label : str
+        (Default: 'name')
+        The property that holds the names of the subregions (the glabel of the choropleth).
+
+    seed : int
+        (Default: 0)
+        The seed of the random number generator.
+
+    """
+    if n_vertices < 4:
+        raise ValueError('a ring has at least 4 coordinates, got n_vertices={}'.format(n_vertices))
+
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(n_features)))
+    width, height = 360/side, 160/side
+    k = np.arange(n_features)
+    lon = -180 + (k % side + 0.5)*width
+    lat = -80 + (k//side + 0.5)*height
+    multi = rng.random(n_features) < multipolygon
+
+    #star-shaped rings: the radius varies with the angle but every ray from the center crosses the ring once
+    angles = np.linspace(0, 2*np.pi, n_vertices - 1, endpoint=False)
+    radius = 0.5*min(width, height)*(0.7 + 0.25*rng.random((n_features, n_vertices - 1)))
+    offset = np.where(multi, width/4, 0)[:, None]
+    scale = np.where(multi, 0.45, 0.9)[:, None]
+
+    def rings(sign):
+        x = lon[:, None] + sign*offset + scale*radius*np.cos(angles)
+        y = lat[:, None] + scale*radius*np.sin(angles)
+        ring = np.round(np.stack([x, y], axis=-1), 6)
+        return np.concatenate([ring, ring[:, :1]], axis=1).tolist()
+
+    left, right = rings(-1), rings(1)
+    features = []
+    for j in range(n_features):
+        if multi[j]:
+            geometry = dict(type='MultiPolygon', coordinates=[[left[j]], [right[j]]])
+        else:
+            geometry = dict(type='Polygon', coordinates=[left[j]])
+        features.append(dict(type='Feature', properties={label: 'region{}'.format(j)}, geometry=geometry))
+
+    return dict(type='FeatureCollection', features=features)
+
+def make_dataframe(n_features, missing_rate=0.1, columns=('value',), seed=0):
+    """Return a dataframe indexed by the names of the subregions of make_geojson(n_features, ...), with lognormal
+    values in each of columns and a fraction missing_rate of the values missing (NaN).
+
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(10, 1, (n_features, len(columns)))
+    values[rng.random(values.shape) < missing_rate] = np.nan
+    return pd.DataFrame(values, index=['region{}'.format(k) for k in range(n_features)], columns=list(columns))
+
+def write_geojson(geojson, path, ndjson=False):
+    """Write geojson to path, as a FeatureCollection or as newline-delimited features (ndjson=True)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        if ndjson:
+            for feature in geojson['features']:
+                f.write(json.dumps(feature))
+                f.write('\n')
+        else:
+            json.dump(geojson, f)
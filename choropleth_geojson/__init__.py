@@ -6,19 +6,86 @@ the countries with varying shades of red that represent the magnitude of the pop
 least populous country to dark red to the most populous country.
 """
 
-import json
+from contextlib import nullcontext
 import numpy as np
-import pandas as pd
-from matplotlib.colors import Normalize, to_rgba
-from matplotlib import cm
-import plotly.offline as offline
+from .colors import get_colormap, lut_colormap, normalize, to_rgba
+from .geometry import geometry_index, pixel_tolerance
+from .join import key_normalizer, region_join
+from .loader import iter_features, load_geometry
+from .cache import lru_cache, series_key, style_key
+from .batch import render_batch, write_figure
+from .serialize import to_json, write_html, write_json
+from .profiler import stage_profiler
+from .classify import class_edges, class_indices, jenks_edges
+from .streaming import stream_figure
+from .spatial import extent, fit_view, grid_index
+
+def _rgba_strings(rgba):
+    """Format an (n, 4) array of RGBA bytes as an object array of 'rgba(r, g, b, a)' strings. Only the distinct colors
+    are formatted, a colormap yields at most a few hundred of those however many values are mapped."""
+    rgba = np.ascontiguousarray(rgba, dtype=np.uint8).reshape(-1, 4)
+    unique, inverse = np.unique(rgba.view(np.uint32).ravel(), return_inverse=True)
+    colors = unique.view(np.uint8).reshape(-1, 4).tolist()
+    table = np.array(['rgba({}, {}, {}, {})'.format(*color) for color in colors], dtype=object)
+    return table[inverse.ravel()]
+
+def _hover_values(values, round_=None, missing_label='No data'):
+    """Return an object array with the values rounded to round_ decimal places (if numeric) and missing_label where the
+    values are missing, the values as they are displayed in the hover texts."""
+    import pandas as pd
+    values = pd.Series(values)
+    missing = values.isna().values
+    if round_ is not None and pd.api.types.is_numeric_dtype(values):
+        values = values.round(round_)
+    values = np.array(values.astype(object), dtype=object)
+    values[missing] = missing_label
+    return values
+
+def _hover_strings(values, round_=None, missing_label='No data'):
+    """Return an object array with the values formatted as in _hover_values, as strings. Only the distinct values are
+    formatted, the rounded data of a map usually has far fewer of those than subregions."""
+    import pandas as pd
+    values = pd.Series(values)
+    if round_ is not None and pd.api.types.is_numeric_dtype(values):
+        values = values.round(round_)
+    codes, uniques = pd.factorize(values)
+    table = np.array([str(value) for value in np.asarray(uniques, dtype=object)] + [missing_label], dtype=object)
+    return table[codes]
+
+def _count_vertices(features):
+    """Return the number of coordinates in the Polygon and MultiPolygon geometries of features."""
+    count = 0
+    for feature in features:
+        geometry = feature.get('geometry') or {}
+        if geometry.get('type') == 'Polygon':
+            count += sum(len(ring) for ring in geometry['coordinates'])
+        elif geometry.get('type') == 'MultiPolygon':
+            count += sum(len(ring) for polygon in geometry['coordinates'] for ring in polygon)
+    return count
+
+def _hover_rows(hover, rows):
+    """Return the hover attributes of a trace that draws the rows (a boolean array or a slice) of the subregions."""
+    return {key: value[rows].tolist() if isinstance(value, np.ndarray) else value for key, value in hover.items()}
+
+def _copy_data(obj):
+    """Return a copy of the nested dictionaries, lists and arrays of the traces or layers in obj that shares their geometry
+    with obj, the features of the geojson of the traces and the sources of the layers.
+
+    """
+    if isinstance(obj, dict):
+        return {key: list(value) if key == 'features' else value if key == 'source' else _copy_data(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_data(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return obj.copy()
+    return obj
 
 class choropleth():
     """The main class to perform the choropleth map plotting. The main method to perform the plot is choroplot(), other methods are auxiliary methods.
 
     """
 
-    def __init__(self, apikey, df, geojson, glabel):
+    def __init__(self, apikey, df, geojson, glabel, normalize=None, cache_size=32):
         """
         Parameters
         ----------
@@ -39,6 +106,21 @@ class choropleth():
         glabel : str
             The label of the subregion in the geojson dictionary, e.g. 'State', 'County', 'Name', 'ID', etc.
 
+        normalize : callable
+            (Default: None, case-insensitive matching that ignores leading and trailing whitespace)
+            How the index of the pandas_dataframe and the subregion labels are normalized before they are matched.
+            Use a key_normalizer, e.g. key_normalizer(fold_unicode=True, aliases={'USA': 'United States'}), or any
+            callable that takes a sequence of keys and returns a pandas Index of the normalized keys.
+
+        cache_size : int
+            (Default: 32)
+            The maximum number of entries in each of the caches of the instance (see cache_info). The instance keeps the
+            artifacts of the figures it builds, so that repeated calls of choroplot() only rebuild what changed:
+
+            * geometry: the processed subregions (features, layer sources, centers) and the label index of the join.
+            * data: the colors and hover texts, per data column and color and text options.
+            * layout: the assembled traces and layers, per geometry, data and style options.
+
         """
         """
 
@@ -54,12 +136,60 @@ class choropleth():
         self.df_ = df
         self.geojson_ = geojson
         self.glabel_ = glabel
+        self.normalize_ = normalize
+
+        self.n_ = len(self.geojson_['features']) if geojson is not None else 0
+        self.properties_ = None
+        self.geometry_ = None
+        self.spatial_ = None
+        self.lods_ = None
+        self.lod_options_ = None
+        self.lat_ = 0
+        self.join_report_ = None
+        self.profile_ = None
+        self.profiler_ = None
+        self.fig_ = None
+        self.state_ = None
+        self.bbox_ = None
+        self.selection_ = None
+        self.cache_ = dict(geometry=lru_cache(cache_size), data=lru_cache(cache_size), layout=lru_cache(cache_size))
+
+    #construct from a geojson file with a cached, memory-mapped geometry
+    @classmethod
+    def from_file(cls, path, apikey, df, glabel, normalize=None, cache=True, cache_dir=None, cache_size=32):
+        """Return an instance of the choropleth class for the geojson file at path, without loading the file into a
+        geojson dictionary. The features are parsed one at a time and their coordinates go straight into the geometry
+        index (see get_geometry). The compiled geometry is kept in a cache directory, keyed by the path, size and
+        modification time of the file, and is memory-mapped by the following calls, so an unchanged file is not parsed again.
+
+        Parameters
+        ----------
+        path : str
+            The path of the geojson file, a FeatureCollection or a newline-delimited file with one Feature per line.
+
+        apikey, df, glabel, normalize, cache_size
+            See __init__.
+
+        cache : bool
+            (Default: True)
+            Keep the compiled geometry in the cache directory and reuse it.
 
-        self.n_ = len(self.geojson_['features'])
+        cache_dir : str
+            (Default: None, the directory in the environment variable CHOROPLETH_GEOJSON_CACHE, or ~/.cache/choropleth_geojson)
+            The cache directory.
+
+        """
+        plot = cls(apikey, df, None, glabel, normalize, cache_size)
+        plot.geometry_, plot.properties_ = load_geometry(path, cache, cache_dir)
+        plot.n_ = len(plot.properties_)
+        return plot
 
     #main plot function
     def choroplot(self, cmap='coolwarm', ptitle='', ctitle='', lat=0, lon=0, zoom=0, opacity=1, col_str='', \
-                  missing_label='No data', missing_color='0.5', round_=None, scale=1, ticks='outside', layer_line_dict={}, layer_fill_dict={}, **kwargs):
+                  missing_label='No data', missing_color='0.5', round_=None, scale=1, ticks='outside', layer_line_dict={}, layer_fill_dict={}, \
+                  mode='layers', nstops=32, centers='mean', animate=False, frame_duration=500, simplify=None, simplify_px=None, \
+                  lod=None, precision=None, hover='text', hover_fields=None, profile=False, profile_memory=True, \
+                  scheme=None, bins=5, edges=None, bbox=None, fit=False, **kwargs):
 
         """
         Parameters
@@ -125,9 +255,13 @@ class choropleth():
             (Default: 1)
             The opacity of the plotted color on the subregions.
 
-        col_str: str
+        col_str: str or list of str
             (Default: '')
-            The column string of the pandas_dataframe where the data for each subregion is stored.
+            The column string of the pandas_dataframe where the data for each subregion is stored. If col_str is a list of
+            column strings, a list with one figure per column is returned (or a single animated figure, see animate).
+            The geometry of the subregions is processed once and only the colors and hover texts are computed per column.
+            For a time-indexed pandas_dataframe (one row per period and one column per subregion), construct the choropleth
+            with its transpose, e.g. df.T, and pass the periods as col_str.
 
         missing_label: str
             (Default: 'No data')
@@ -178,6 +312,132 @@ class choropleth():
             perform any updates.)
 
             This feature is intended for advanced users only who know how to manipulate Mapbox line and fill displays.
+            With mode='trace' only the 'below' entry of layer_fill_dict is used, and it is applied to the choropleth trace.
+
+        mode: str
+            (Default: 'layers')
+            How the subregions are rendered. Possible values are one of the following,
+
+            * 'layers': one Mapbox line layer and one Mapbox fill layer per subregion, each layer carrying its own
+              copy of the subregion coordinates. This is the original rendering mode.
+            * 'trace': a single choroplethmapbox trace over one shared FeatureCollection, with the fill colors
+              driven by the data through the colorscale. Every subregion is emitted once, which keeps the figure
+              small and fast to draw for maps with many subregions. Subregions without data are drawn by a second
+              trace in the missing_color.
+
+        nstops: int
+            (Default: 32)
+            The number of stops in the colorscale of the colorbar. The colorscale is interpolated linearly between
+            the stops, so a few dozen stops reproduce the colormap closely independent of the number of subregions.
+
+        centers: str
+            (Default: 'mean')
+            Where the hover text of each subregion is anchored (mode='layers'). Possible values are one of the following,
+
+            * 'mean': the mean of the coordinates of the largest polygon of the subregion (the polygon with the most coordinates).
+            * 'area': the area-weighted centroid of the subregion.
+
+        animate: bool
+            (Default: False)
+            If True, return a single figure with one animation frame per column of col_str and a slider to step through
+            them. The frames share one color range and only carry the data, colors and hover texts, the subregions are
+            emitted once. Requires mode='trace'.
+
+        frame_duration: num
+            (Default: 500)
+            The duration in milliseconds of each frame when the animation is played.
+
+        simplify: num
+            (Default: None (no simplification))
+            The tolerance in degrees with which the outlines of the subregions are simplified by the Douglas-Peucker algorithm
+            before they are plotted. Coordinates closer than the tolerance to the simplified outline are removed, which shrinks
+            large geojson files considerably. The geojson file itself is not modified.
+
+        simplify_px: num
+            (Default: None (no simplification))
+            The simplification tolerance given in pixels at the zoom and the latitude of the plot instead of in degrees,
+            e.g. 0.5 removes the detail that cannot be seen at the initial zoom. Overrides simplify.
+
+        lod: str
+            (Default: None (no levels of detail))
+            Use the levels of detail of the subregions, simplified copies of the geojson file cached on the instance (see
+            build_lods, the default levels are built on first use, at the latitude of the plot). Overrides simplify and
+            simplify_px. Possible values are
+            one of the following,
+
+            * 'auto': plot the coarsest level that is still detailed enough for the zoom of the plot.
+            * 'zoom': emit every level as Mapbox layers that are only displayed within the zoom range of the level, so the
+              detail follows the zoom when the map is navigated. Requires mode='layers'.
+
+        precision: int
+            (Default: None (full precision))
+            The number of decimal places the coordinates of the subregions are rounded to in the figure, consecutive
+            coordinates that become identical are merged. 5 decimal places (about 1 meter) is plenty for display and
+            shrinks the coordinates in the figure about threefold compared to full precision.
+
+        hover: str
+            (Default: 'text')
+            How the hover texts are produced. Possible values are one of the following,
+
+            * 'text': the hover text of every subregion is formatted when the figure is built (see get_hover_text).
+            * 'template': the hover texts are assembled by plotly from a hovertemplate when the map is hovered. Only the
+              values that are not already in the figure (the names of the subregions in mode='layers', the scaled
+              values when scale is not 1 and the hover_fields) are emitted, as the customdata of the trace, which keeps
+              large figures smaller. With mode='trace' and scale=1 no per-subregion hover data is emitted at all.
+
+        hover_fields: list of str
+            (Default: None (no other fields))
+            Other columns of the pandas_dataframe to display in the hover texts, one line 'column: value' per column.
+            round_ applies to them as well, scale does not.
+
+        profile: bool or callable
+            (Default: False)
+            Profile the call. The wall time and the memory of each stage (reindex_df, make_features, make_sources,
+            get_centers, get_color_info, get_hover_text, layers (the assembly of the traces and layers) and serialize
+            (the JSON encoding of the figures, done only to measure them)) and the counts of features, vertices,
+            figures, traces, layers and output bytes are stored in the profile_ attribute as a dictionary (see
+            stage_profiler.report, with the cache statistics added). The stages served from the caches of the instance
+            take next to no time, and those that are never run do not appear. If profile is a callable, it is also
+            called with the report.
+
+        profile_memory: bool
+            (Default: True)
+            Record the memory of the stages with tracemalloc when profiling, which slows the stages down.
+
+        scheme: str
+            (Default: None (a linear color scale from the minimum to the maximum of the data))
+            How the data is mapped to the colors. Possible values are one of the following,
+
+            * 'log': a logarithmic color scale, for positive data spread over orders of magnitude.
+            * 'quantile': bins classes with the same number of subregions.
+            * 'equal_interval': bins classes of the same width between the minimum and the maximum of the data.
+            * 'jenks': the bins natural breaks of Jenks, the classes that minimize the squared deviations of the data
+              from the mean of their class.
+            * 'edges': the classes given by edges.
+
+            With a classification scheme the subregions of a class share one color, the colors of the classes are
+            evenly spaced along cmap, and the colorbar is a step function with two stops per class.
+
+        bins: int
+            (Default: 5)
+            The number of classes of the 'quantile', 'equal_interval' and 'jenks' schemes.
+
+        edges: list of num
+            (Default: None)
+            The increasing edges of the classes, e.g. [0, 10, 100, 1000] for three classes. Implies scheme='edges'.
+
+        bbox: tuple of num
+            (Default: None (all the subregions))
+            The bounding box (west, south, east, north) in degrees of the area to plot. Only the subregions that intersect
+            it are emitted, e.g. the states of a region of a national boundary file, which shrinks the figure accordingly.
+            The west and east edges are longitudes from -180 to 180, a box whose west edge is greater than its east edge
+            crosses the antimeridian. The subregions are found with a
+            grid index of their bounding boxes, built once per instance (see get_spatial_index).
+
+        fit: bool
+            (Default: False)
+            Center and zoom the map on the subregions with data (within bbox, if given) instead of using lat, lon and
+            zoom. The size of the map is taken from the width and height kwargs (1000 x 800 pixels by default).
 
         kwargs
             Keyword arguments to pass to the Mapbox layout dictionary. Intended for advanced users only.
@@ -188,7 +448,7 @@ class choropleth():
         Returns
         -------
         output: dict
-            A matplotlib figure dictionary for display and saving.
+            A matplotlib figure dictionary for display and saving, or a list of them if col_str is a list.
 
         """
         
@@ -205,26 +465,354 @@ class choropleth():
         self.round_ = round_
         self.scale_ = scale
         self.ticks_ = ticks
+        self.hover_ = hover
+        self.hover_fields_ = hover_fields
+        self.tolerance_ = simplify
+        self.precision_ = precision
+        self.lod_ = lod
+        if lod == 'zoom' and mode != 'layers':
+            raise ValueError("lod='zoom' requires mode='layers'")
+        elif lod not in (None, 'auto', 'zoom'):
+            raise ValueError("lod must be one of None, 'auto' or 'zoom', got {!r}".format(lod))
         
-        self.reindex_df()
+        if mode not in ('layers', 'trace'):
+            raise ValueError("mode must be one of 'layers' or 'trace', got {!r}".format(mode))
+        if hover not in ('text', 'template'):
+            raise ValueError("hover must be one of 'text' or 'template', got {!r}".format(hover))
+        if edges is not None and scheme is None:
+            scheme = 'edges'
+        if scheme not in (None, 'log', 'quantile', 'equal_interval', 'jenks', 'edges'):
+            raise ValueError("scheme must be one of None, 'log', 'quantile', 'equal_interval', 'jenks' or 'edges', got {!r}".format(scheme))
+        self.scheme_ = scheme
+        self.bins_ = bins
+        self.edges_ = None if edges is None else tuple(float(edge) for edge in edges)
+
+        self.bbox_ = None if bbox is None else tuple(float(edge) for edge in bbox)
+        self.selection_ = None
+        if bbox is not None:
+            if len(self.bbox_) != 4 or self.bbox_[1] > self.bbox_[3] or not all(-180 <= self.bbox_[k] <= 180 for k in (0, 2)):
+                raise ValueError('bbox must be (west, south, east, north) with south <= north and west and east from -180 to 180, '
+                                 'got {!r}'.format(bbox))
+            self.selection_ = self.get_spatial_index().query(*self.bbox_)
+            if not len(self.selection_):
+                raise ValueError('no subregion intersects bbox {!r}'.format(bbox))
+
+        self.profile_ = None
+        if profile:
+            self.profiler_ = stage_profiler(memory=profile_memory)
+            self.profiler_.start()
+        try:
+            with self.stage('reindex_df'):
+                df = self.reindex_df()
+            fields = df[list(hover_fields)] if hover_fields else None
+
+            batch = isinstance(col_str, (list, tuple)) and not animate
+            if isinstance(col_str, (list, tuple)):
+                cols = list(col_str)
+            elif self.col_str_:
+                cols = [col_str]
+            else:
+                cols = [df.columns[0]]
+
+            #the view is needed for the tolerances given in pixels
+            if fit:
+                self.lat_, self.lon_, self.zoom_ = self.get_view(df[cols], kwargs)
+            if lod == 'auto':
+                self.tolerance_ = self.get_lod(self.zoom_)
+            elif simplify_px:
+                self.tolerance_ = pixel_tolerance(simplify_px, self.zoom_, self.lat_)
+
+            colors = None
+            if animate:
+                figs = [self.make_animation(df, cols, mode, nstops, layer_fill_dict, frame_duration, kwargs, fields)]
+            else:
+                figs, colors = zip(*[self.make_figure(df[col], mode, nstops, centers, layer_line_dict, layer_fill_dict, kwargs, fields) \
+                                     for col in cols])
+                figs = list(figs)
+
+            #the state of a single figure, for update_data
+            self.state_ = None
+            if not batch and not animate:
+                self.state_ = dict(col=cols[0], series=df[cols[0]], colors=colors[0], \
+                                   mode=mode, nstops=nstops, centers=centers, hover_fields=hover_fields, \
+                                   layer_line_dict=layer_line_dict, layer_fill_dict=layer_fill_dict, layout_kwargs=kwargs)
+
+            if profile:
+                self.count_profile(figs)
+        finally:
+            if profile:
+                self.profiler_.stop()
+                self.profile_ = dict(self.profiler_.report(), cache=self.cache_info())
+                self.profiler_ = None
+
+        self.fig_ = figs if batch else figs[0]
+        if callable(profile):
+            profile(self.profile_)
+        return self.fig_
         
-        if self.col_str_:
-            series = self.df_[col_str]
+    #serialization of the figures
+    def to_json(self, fig=None):
+        """Return the figure of the last choroplot() call (the fig_ attribute), or fig, as a JSON string. The figure is
+        encoded directly, without plotly's validation (see the serialize module).
+
+        """
+        return to_json(self.get_fig(fig))
+
+    def write_html(self, path, fig=None, include_plotlyjs='cdn', config=None, auto_open=False):
+        """Write the figure of the last choroplot() call (the fig_ attribute), or fig, to path as a standalone HTML file.
+        This is a faster alternative to plotly.offline.plot(fig, filename=path), the figure is encoded directly, without
+        plotly's validation. include_plotlyjs is 'cdn' (load plotly.js from the plotly CDN), True (embed plotly.js in the
+        file) or False (see serialize.write_html).
+
+        """
+        write_html(self.get_fig(fig), path, include_plotlyjs, config, auto_open)
+
+    def get_fig(self, fig=None):
+        """Return fig, or the figure of the last choroplot() call if fig is None."""
+        fig = self.fig_ if fig is None else fig
+        if fig is None:
+            raise ValueError('no figure to serialize, call choroplot() first')
+        if isinstance(fig, list):
+            raise ValueError('the last choroplot() call returned a list of figures, pass one of them as fig')
+        return fig
+
+    ###auxiliary functions###  
+
+    #the figure of one column of data
+    def make_figure(self, series, mode, nstops=32, centers='mean', layer_line_dict={}, layer_fill_dict={}, layout_kwargs={}, fields=None):
+        """Return the figure dictionary of the data in series with the style options of the last choroplot() call, and the
+        scatter_colors of the subregions (see get_color_info).
+        The colors, hover texts, traces and layers are taken from the caches of the instance when they were already built
+        for the same data and options, only the layout dictionary itself is always rebuilt. The figure gets a copy of the
+        cached traces and layers, down to their style dictionaries and per-subregion lists, so that editing a figure does
+        not change the following ones, while the geometry (the features and the sources) is shared.
+
+        """
+        color_key, hover_key, scatter_colors, colorscale, hover = self.get_data_info(series, mode, nstops, fields)
+
+        layout_key = (mode, self.lod_, tuple(self.get_lod_ranges()) if self.lod_ == 'zoom' else None, self.tolerance_, self.precision_, centers, color_key, hover_key, self.opacity_, \
+                      style_key(self.ctitle_), self.ticks_, style_key(layer_line_dict), style_key(layer_fill_dict))
+        with self.stage('layers'):
+            data, layers = self.cache_['layout'].get(layout_key, \
+                lambda: self.make_data(series, mode, centers, scatter_colors, colorscale, hover, layer_line_dict, layer_fill_dict, fields))
+
+        data, layers = _copy_data(data), _copy_data(layers)
+        return dict(data=data, layout=self.make_layout(layers, layout_kwargs)), scatter_colors
+
+    #the colors and hover texts of one column of data
+    def get_data_info(self, series, mode, nstops=32, fields=None):
+        """Return the cache keys and the values of the colors and the hover texts of the data in series, as the tuple
+        (color_key, hover_key, scatter_colors, colorscale, hover), see get_color_info and make_hover.
+
+        """
+        data_key = series_key(series)
+        color_key = ('colors', data_key, style_key(self.cmap_), style_key(self.missing_color_), nstops, self.scheme_, self.bins_, self.edges_)
+        hover_key = ('hover', data_key, self.round_, self.scale_, self.missing_label_, self.hover_, mode, \
+                     None if fields is None else series_key(fields))
+
+        with self.stage('get_color_info'):
+            scatter_colors, colorscale = self.cache_['data'].get(color_key, \
+                lambda: choropleth.get_color_info(series, self.cmap_, self.missing_color_, nstops, \
+                                                  scheme=self.scheme_, bins=self.bins_, edges=self.edges_))
+        with self.stage('get_hover_text'):
+            hover = self.cache_['data'].get(hover_key, lambda: self.make_hover(series, mode, fields))
+
+        return color_key, hover_key, scatter_colors, colorscale, hover
+
+    #recolor the last figure with new data
+    def update_data(self, df, col_str=None):
+        """Replace the pandas_dataframe of the instance with df and return the patch that updates the figure of the last
+        choroplot() call to the data of df, without sending the geometry of the subregions again. Only the join, the
+        colors and the hover texts are recomputed, with the options of that call. The fig_ attribute is updated as well
+        (the figure dictionaries returned by choroplot() are left unchanged).
+
+        Parameters
+        ----------
+        df : pandas_dataframe object
+            The new data, with the same layout as the pandas_dataframe of the instance.
+
+        col_str : str
+            (Default: None, the column of the last choroplot() call)
+            The column of df to plot.
+
+        """
+        """
+        Returns
+        -------
+        output: dict
+            The patch, a dictionary with the entries
+
+            * restyle: a list of the [update, traces] arguments of Plotly.restyle, the values in update are wrapped in a
+              list per trace as Plotly.restyle expects. With mode='trace' the update carries the locations, z, zmin, zmax
+              and hover texts of the trace with the data (and a second update of the hover texts of the trace of the
+              missing data, which show the hover_fields), with mode='layers' the colors, cmin, cmax and hover texts of
+              the scattermapbox trace. With a scheme, whose colorscale depends on the data, the colorscale as well.
+            * relayout: the update argument of Plotly.relayout, the colors of the fill layers that changed as
+              'mapbox.layers[k].color' entries (mode='layers').
+            * figure: None, or the whole new figure when it cannot be patched (mode='trace' when the set of subregions
+              with data changed, which changes the geometry of the traces), e.g. for Plotly.react.
+
+        """
+        if self.state_ is None or self.fig_ is None:
+            raise ValueError('update_data requires the figure of a choroplot() call that returned a single, non-animated figure')
+
+        state = self.state_
+        col = state['col'] if col_str is None else col_str
+        mode = state['mode']
+
+        self.df_ = df
+        df = self.reindex_df()
+        series = df[col]
+        fields = df[list(state['hover_fields'])] if state['hover_fields'] else None
+        _, _, scatter_colors, colorscale, hover = self.get_data_info(series, mode, state['nstops'], fields)
+
+        previous = state['series']
+        has_data = series.notna().values
+        vmin, vmax = [None if np.isnan(value) else float(value) for value in (series.min(), series.max())]
+        previous_colors = np.asarray(state['colors'], dtype=object)
+        state.update(col=col, series=series, colors=scatter_colors)
+        #the per-subregion hover entries (text or customdata), the templates do not change
+        hover_arrays = {key: value for key, value in hover.items() if isinstance(value, np.ndarray)}
+
+        if mode == 'trace' and not np.array_equal(has_data, previous.notna().values):
+            self.fig_, _ = self.make_figure(series, mode, state['nstops'], state['centers'], state['layer_line_dict'], \
+                                            state['layer_fill_dict'], state['layout_kwargs'], fields)
+            return dict(restyle=[], relayout={}, figure=self.fig_)
+
+        fig = self.fig_
+        data = list(fig['data'])
+        layout = fig['layout']
+        if mode == 'trace':
+            trace = dict(locations=list(series.index[has_data]), z=series[has_data].tolist(), zmin=vmin, zmax=vmax, \
+                         **_hover_rows(hover_arrays, has_data))
+            if self.scheme_ is not None:
+                trace['colorscale'] = colorscale
+            data[0] = dict(data[0], **trace)
+            restyle = [[{key: [value] for key, value in trace.items()}, [0]]]
+            if len(data) > 1:
+                missing = self.make_missing(series, fields)
+                data[1] = dict(data[1], **missing)
+                restyle.append([{key: [value] for key, value in missing.items()}, [1]])
+            relayout = {}
         else:
-            series = self.df_[self.df_.columns[0]]
-            
-        sources = choropleth.make_sources(self.geojson_)
-        lat_cen, lon_cen = choropleth.get_centers(self.geojson_)
+            trace = _hover_rows(hover_arrays, slice(None))
+            marker = dict(color=scatter_colors, cmin=vmin, cmax=vmax)
+            if self.scheme_ is not None:
+                marker['colorscale'] = colorscale
+            data[0] = dict(data[0], marker=dict(data[0]['marker'], **marker), **trace)
+            update = {key: [value] for key, value in trace.items()}
+            update.update({'marker.' + key: [value] for key, value in marker.items()})
+            restyle = [[update, [0]]]
+
+            #the fill layers follow the line layers, n of each per level of detail
+            n = len(series)
+            layers = list(layout['mapbox']['layers'])
+            changed = np.flatnonzero(np.asarray(scatter_colors, dtype=object) != previous_colors)
+            relayout = {}
+            for level in range(0, len(layers), 2*n):
+                for k in changed:
+                    position = level + n + k
+                    layers[position] = dict(layers[position], color=scatter_colors[k])
+                    relayout['mapbox.layers[{}].color'.format(position)] = scatter_colors[k]
+            layout = dict(layout, mapbox=dict(layout['mapbox'], layers=layers))
+
+        self.fig_ = dict(fig, data=data, layout=layout)
+        return dict(restyle=restyle, relayout=relayout, figure=None)
+
+    #the traces and layers of one column of data
+    def make_data(self, series, mode, centers, scatter_colors, colorscale, hover, layer_line_dict={}, layer_fill_dict={}, fields=None):
+        """Return the data, the list of traces, and the Mapbox layers of the figure for the data in series."""
+        if mode == 'layers':
+            with self.stage('get_centers'):
+                lat_cen, lon_cen = self.cache_['geometry'].get(('centers', centers), \
+                    lambda: choropleth.get_centers(self.get_geometry(), centers))
+                lat_cen, lon_cen = self.select(lat_cen), self.select(lon_cen)
+
+        if mode == 'layers' and self.lod_ == 'zoom':
+            layers = []
+            for minzoom, maxzoom, tolerance in self.get_lod_ranges():
+                data, level = self.make_layers(series, self.select(self.get_sources(tolerance, self.precision_)), lat_cen, lon_cen, scatter_colors, colorscale, hover, \
+                                               dict(layer_line_dict, minzoom=minzoom, maxzoom=maxzoom), \
+                                               dict(layer_fill_dict, minzoom=minzoom, maxzoom=maxzoom))
+                layers += level
+        elif mode == 'layers':
+            data, layers = self.make_layers(series, self.select(self.get_sources(self.tolerance_, self.precision_)), lat_cen, lon_cen, scatter_colors, colorscale, hover, \
+                                            layer_line_dict, layer_fill_dict)
+        else:
+            data, layers = self.make_traces(series, colorscale, hover, layer_fill_dict, fields=fields), []
+
+        return data, layers
 
-        scatter_colors, colorscale = choropleth.get_color_info(series, self.cmap_, self.missing_color_)
-        hover_text = choropleth.get_hover_text(series, self.round_, self.scale_, self.missing_label_)
+    #a single figure with one animation frame per column of data
+    def make_animation(self, df, cols, mode, nstops=32, layer_fill_dict={}, frame_duration=500, layout_kwargs={}, fields=None):
+        """Return a figure dictionary with one frame per column in cols. All frames share the color range of the columns.
+        The geometry is carried by the traces of the figure, the frames only update the locations, values and hover texts
+        of the trace with the data and, when some subregions have no data in some frames, the locations and hover texts of
+        the trace of the missing data, so that a subregion is drawn by one trace or the other in each frame.
 
+        """
+        if mode != 'trace':
+            raise ValueError("animate=True requires mode='trace'")
+
+        values = df[cols]
+        has_data = values.notna().values
+        zmin, zmax = np.nanmin(values.values), np.nanmax(values.values)
+        with self.stage('get_color_info'):
+            #the classes of a binned scheme are computed over the data of all the frames
+            edges = self.edges_
+            if self.scheme_ not in (None, 'log') and edges is None:
+                edges = class_edges(values.values.ravel(), self.scheme_, self.bins_)
+            _, colorscale = choropleth.get_color_info(values[cols[0]], self.cmap_, self.missing_color_, nstops, zmin, zmax, \
+                                                      self.scheme_, self.bins_, edges)
+
+        missing_features = ~has_data.all(axis=1)
+        traces = [0, 1] if missing_features.any() else [0]
+        frames, hovers = [], []
+        for k, col in enumerate(cols):
+            series = values[col]
+            with self.stage('get_hover_text'):
+                hover = self.make_hover(series, mode, fields)
+                data = [dict(type='choroplethmapbox',
+                             locations=list(series.index[has_data[:, k]]),
+                             z=series[has_data[:, k]].tolist(),
+                             **_hover_rows(hover, has_data[:, k]))]
+                if len(traces) > 1:
+                    data.append(dict(type='choroplethmapbox', **self.make_missing(series, fields)))
+            hovers.append(hover)
+            frames.append(dict(name=str(col), data=data, traces=traces))
+
+        with self.stage('layers'):
+            data = self.make_traces(values[cols[0]], colorscale, hovers[0], layer_fill_dict, zmin, zmax, \
+                                    data_features=has_data.any(axis=1), missing_features=missing_features, fields=fields)
+
+        steps = [dict(method='animate', label=str(col),
+                      args=[[str(col)], dict(mode='immediate', frame=dict(duration=frame_duration, redraw=True), transition=dict(duration=0))])
+                 for col in cols]
+        buttons = [dict(label='Play', method='animate',
+                        args=[None, dict(frame=dict(duration=frame_duration, redraw=True), transition=dict(duration=0), fromcurrent=True)]),
+                   dict(label='Pause', method='animate',
+                        args=[[None], dict(mode='immediate', frame=dict(duration=0, redraw=False), transition=dict(duration=0))])]
+
+        layout = self.make_layout([], dict(sliders=[dict(active=0, steps=steps)],
+                                           updatemenus=[dict(type='buttons', showactive=False, buttons=buttons)]))
+        layout.update(layout_kwargs)
+        return dict(data=data, layout=layout, frames=frames)
+
+    #the layout of the figure
+    def make_layout(self, layers, layout_kwargs={}):
+        """Return the layout dictionary of the figure, with the Mapbox layers and the keyword arguments of choroplot()."""
+        return choropleth.get_layout(self.ptitle_, self.apikey_, layers, self.lat_, self.lon_, self.zoom_, layout_kwargs)
+
+    #the scattermapbox trace and the per-subregion layers
+    def make_layers(self, series, sources, lat_cen, lon_cen, scatter_colors, colorscale, hover, layer_line_dict={}, layer_fill_dict={}):
+        """Return the data, a list with the scattermapbox trace that carries the hover texts and the colorbar, and the layers,
+        the Mapbox line and fill layers with one layer of each per subregion (mode='layers').
+
+        """
         data = dict(type='scattermapbox',
             lat=lat_cen,
             lon=lon_cen,
             mode='markers',
-            text=hover_text,
-            hoverinfo='text',
             marker=dict(size=1,
                         color = scatter_colors,
                         showscale = True,
@@ -234,9 +822,7 @@ class choropleth():
                         colorbar = dict(title = self.ctitle_, ticks = self.ticks_)
                        )           
              )
-
-        
-                       
+        data.update(_hover_rows(hover, slice(None)))
 
         layer_line_vec = [dict(
                           sourcetype = 'geojson',
@@ -245,7 +831,7 @@ class choropleth():
                           line = dict(width = 1),
                           color = 'black',
                           )
-                          for k in range(self.n_)]
+                          for k in range(len(sources))]
 
         layer_fill_vec = [dict(
                               sourcetype = 'geojson',
@@ -253,7 +839,7 @@ class choropleth():
                               type = 'fill',
                               color = scatter_colors[k],
                               opacity = self.opacity_
-                              ) for k in range(self.n_)]
+                              ) for k in range(len(sources))]
 
         for k in layer_line_vec:
             k.update(layer_line_dict)
@@ -268,118 +854,452 @@ class choropleth():
                 layer_fill_vec          
                 )
 
+        return [data], layers
+
+    #choroplethmapbox traces over a single shared FeatureCollection
+    def make_traces(self, series, colorscale, hover, layer_fill_dict={}, zmin=None, zmax=None, data_features=None, missing_features=None, fields=None):
+        """Return the data, a list of choroplethmapbox traces that draw every subregion from one FeatureCollection (mode='trace').
+        The subregions with data are colored through the colorscale, the subregions without data are drawn by a second trace
+        in the missing color. By default each subregion is emitted in exactly one of the two traces, data_features and
+        missing_features (boolean arrays) select other subregions for the geojson of each trace, as used by animations,
+        the locations of each trace being the subregions of series with and without data. fields is the dataframe of the
+        hover_fields, if any, for the hover texts of the subregions without data.
+
+        """
+        features = self.select(self.get_features(self.tolerance_, self.precision_))
+        has_data = series.notna().values
+        data_features = has_data if data_features is None else data_features
+        missing_features = ~has_data if missing_features is None else missing_features
+
+        data_style, missing_style = choropleth.get_trace_styles(self.glabel_, self.opacity_, self.ctitle_, self.ticks_, self.missing_color_)
+
+        data = [dict(type='choroplethmapbox',
+                     geojson=dict(type='FeatureCollection',
+                                  features=[features[k] for k in np.flatnonzero(data_features)]),
+                     locations=list(series.index[has_data]),
+                     z=series[has_data].tolist(),
+                     zmin=series.min() if zmin is None else zmin,
+                     zmax=series.max() if zmax is None else zmax,
+                     colorscale=colorscale,
+                     **data_style,
+                     **_hover_rows(hover, has_data)
+                     )]
+
+        if missing_features.any():
+            data.append(dict(type='choroplethmapbox',
+                             geojson=dict(type='FeatureCollection',
+                                          features=[features[k] for k in np.flatnonzero(missing_features)]),
+                             **missing_style,
+                             **self.make_missing(series, fields)
+                             ))
+
+        if 'below' in layer_fill_dict:
+            for trace in data:
+                trace['below'] = layer_fill_dict['below']
+
+        return data
+
+    #the data attributes of the trace of the missing data
+    def make_missing(self, series, fields=None):
+        """Return the attributes of the trace of the subregions without data (mode='trace') that depend on the data in
+        series: the locations, z and hover attributes of the subregions whose data is missing. fields is the dataframe of
+        the hover_fields, if any.
+
+        """
+        missing = series.isna().values
+        hover = self.make_hover(series[missing], 'trace', None if fields is None else fields[missing], missing=True)
+        return dict(locations=list(series.index[missing]), z=[0]*int(missing.sum()), **_hover_rows(hover, slice(None)))
+
+    #the hover attributes of the trace with the data
+    def make_hover(self, series, mode, fields=None, missing=False):
+        """Return the hover attributes of the trace that carries the data in series, a dictionary with either the text or
+        the hovertemplate entries of the trace (see the hover option of choroplot()). The per-subregion entries are arrays
+        over all the subregions of series, each trace takes the rows of the subregions it draws. missing=True gives the
+        attributes of the trace of the subregions without data in mode='trace'.
+
+        """
+        if self.hover_ == 'text':
+            series = series*np.nan if missing else series
+            return dict(text=np.asarray(choropleth.get_hover_text(series, self.round_, self.scale_, self.missing_label_, fields), dtype=object),
+                        hoverinfo='text')
+
+        #the hovertemplate refers to the trace attributes where it can, everything else is a column of the customdata
+        columns = []
+        if mode == 'trace':
+            name = '%{location}'
+        else:
+            name = '%{customdata[0]}'
+            columns.append(np.asarray(series.index.astype(str), dtype=object))
+
+        if missing:
+            value = self.missing_label_
+        elif mode == 'trace' and self.scale_ == 1:
+            value = '%{z}' if self.round_ is None or self.round_ < 0 else '%{{z:.{}~f}}'.format(self.round_)
+        else:
+            value = '%{{customdata[{}]}}'.format(len(columns))
+            columns.append(_hover_values(series*self.scale_, self.round_, self.missing_label_))
+
+        template = '<b>{}</b> <br> {}'.format(name, value)
+        for col in ([] if fields is None else fields.columns):
+            template += ' <br> {}: %{{customdata[{}]}}'.format(col, len(columns))
+            columns.append(_hover_values(fields[col], self.round_, self.missing_label_))
+
+        hover = dict(hovertemplate=template + '<extra></extra>')
+        if columns:
+            hover['customdata'] = np.column_stack(columns)
+        return hover
+
+    #reformat and reindex the df
+    def reindex_df(self):
+        """Return the supplied pandas_dataframe reindexed with the geographical subregions in the geojson file.
+        The geojson file takes precendence, i.e. index names not in the pandas_dataframe will be
+        omitted when mapping the choropleth. The supplied pandas_dataframe itself is not modified.
+
+        The keys that could not be matched are reported in the join_report_ attribute, a dictionary with the lists
+        unmatched_data, unmatched_regions and duplicated_data (see region_join.align). With the bbox option of the last
+        choroplot() call, only the rows of the subregions that intersect the bounding box are returned.
+
+        """
+        join = self.cache_['geometry'].get(('join',), lambda: region_join(self.get_labels(), self.normalize_))
+        df, self.join_report_ = join.align(self.df_)
+        if self.selection_ is not None:
+            df = df.iloc[self.selection_]
+        return df
+
+    #the subregion labels in the geojson file
+    def get_labels(self):
+        """Return the list of the subregion labels (the glabel property of each feature) in the geojson file."""
+        if self.geojson_ is None:
+            return [properties[self.glabel_] for properties in self.properties_]
+        return [feature['properties'][self.glabel_] for feature in self.geojson_['features']]
+
+    #compile the geojson into a geometry index, once per instance
+    def get_geometry(self):
+        """Return the geometry index of the geojson file, a flat array of the coordinates with the offsets of the rings,
+        polygons and subregions in it. The index is built on the first call and reused by the following calls.
+
+        """
+        if self.geometry_ is None:
+            self.geometry_ = geometry_index.from_geojson(self.geojson_)
+        return self.geometry_
+
+    #the grid index of the bounding boxes of the subregions, once per instance
+    def get_spatial_index(self):
+        """Return the spatial index of the subregions, a grid_index of their bounding boxes (see geometry_index.bounds).
+        The index is built on the first call and reused by the following calls.
+
+        """
+        if self.spatial_ is None:
+            self.spatial_ = grid_index(self.get_geometry().bounds())
+        return self.spatial_
+
+    #the subregions in the bounding box
+    def select(self, items):
+        """Return the items (a list or an array with one item per subregion) of the subregions in the bounding box of the
+        last choroplot() call, or all the items without bbox.
+
+        """
+        if self.selection_ is None:
+            return items
+        if isinstance(items, np.ndarray):
+            return items[self.selection_]
+        return [items[k] for k in self.selection_]
+
+    #the center and the zoom of the map from the extent of the data
+    def get_view(self, df, layout_kwargs={}):
+        """Return the latitude, the longitude and the zoom that fit the map to the subregions with data in df (all the
+        subregions of df if none has data), clipped to the bounding box of the bbox option. The size of the map is the
+        width and the height in layout_kwargs, 1000 x 800 pixels by default (see fit_view). The current view is returned
+        when the subregions have no geometry.
+
+        """
+        bounds = self.select(self.get_spatial_index().bounds_)
+        has_data = df.notna().values.any(axis=1)
+        box = extent(bounds[has_data] if has_data.any() else bounds)
+        if box is None:
+            return self.lat_, self.lon_, self.zoom_
+
+        if self.bbox_ is not None and self.bbox_[0] <= self.bbox_[2]:
+            west, south, east, north = self.bbox_
+            box = (max(box[0], west), max(box[1], south), min(box[2], east), min(box[3], north))
+        return fit_view(box, layout_kwargs.get('width', 1000), layout_kwargs.get('height', 800))
+
+    #features and sources for the layers, cached per tolerance and precision
+    def get_features(self, tolerance=None, precision=None):
+        """Return the features of the geojson file, simplified with tolerance and quantized to precision (see make_features).
+        The features are kept in the geometry cache and reused by the following calls with the same tolerance and precision.
+
+        """
+        return self.cache_['geometry'].get(('features', tolerance, precision), lambda: self.build_features(tolerance, precision))
+
+    def build_features(self, tolerance=None, precision=None):
+        """Build the features of get_features, from the geojson dictionary or, for an instance constructed from_file,
+        from the geometry index.
+
+        """
+        with self.stage('make_features'):
+            if self.geojson_ is not None:
+                return choropleth.make_features(self.geojson_, tolerance=tolerance, precision=precision, index=self.get_geometry())
+
+            index = self.get_geometry()
+            if tolerance:
+                index = index.simplify(tolerance)
+            if precision is not None:
+                index = index.quantize(precision)
+            return [dict(type='Feature', properties=properties, geometry=geometry)
+                    for properties, geometry in zip(self.properties_, index.geometries())]
+
+    def get_sources(self, tolerance=None, precision=None):
+        """Return the sources of the layers (see make_sources) of the geojson file, simplified with tolerance and quantized
+        to precision. The sources are kept in the geometry cache and reused by the following calls with the same tolerance
+        and precision.
+
+        """
+        return self.cache_['geometry'].get(('sources', tolerance, precision), lambda: self.build_sources(tolerance, precision))
+
+    def build_sources(self, tolerance=None, precision=None):
+        """Build the sources of get_sources, one FeatureCollection per subregion."""
+        features = self.get_features(tolerance, precision)
+        with self.stage('make_sources'):
+            return [dict(type = 'FeatureCollection', features = [item]) for item in features]
+
+    #profiling of choroplot
+    def stage(self, name):
+        """Return a context manager that records the code run in its with block as the stage name of the profile, when
+        choroplot() is profiled (see the profile option), and does nothing otherwise.
+
+        """
+        return self.profiler_.stage(name) if self.profiler_ is not None else nullcontext()
+
+    def count_profile(self, figs):
+        """Serialize the figures and add the counts of the profile: features, vertices (in the geometry of the
+        figures), figures, traces, layers and output_bytes (of the figures encoded as JSON).
+
+        """
+        with self.stage('serialize'):
+            output_bytes = sum(len(to_json(fig).encode('utf-8')) for fig in figs)
+
+        if self.lod_ == 'zoom':
+            tolerances = [tolerance for _, _, tolerance in self.get_lod_ranges()]
+        else:
+            tolerances = [self.tolerance_]
+
+        self.profiler_.count('features', self.n_ if self.selection_ is None else len(self.selection_))
+        self.profiler_.count('vertices', sum(_count_vertices(self.select(self.get_features(tolerance, self.precision_))) for tolerance in tolerances))
+        self.profiler_.count('figures', len(figs))
+        self.profiler_.count('traces', sum(len(fig['data']) for fig in figs))
+        self.profiler_.count('layers', sum(len(fig['layout']['mapbox']['layers']) for fig in figs))
+        self.profiler_.count('output_bytes', output_bytes)
+
+    #cache statistics
+    def cache_info(self):
+        """Return the hits, misses, size and maximum size of each cache of the instance (geometry, data and layout, see
+        __init__) as a dictionary of dictionaries.
+
+        """
+        return {name: cache.info() for name, cache in self.cache_.items()}
+
+    def clear_cache(self, name=None):
+        """Remove the entries of the cache name (one of 'geometry', 'data' or 'layout'), or of all caches if name is None."""
+        for cache_name, cache in self.cache_.items():
+            if name is None or name == cache_name:
+                cache.clear()
+
+    #levels of detail of the geojson, once per instance
+    def build_lods(self, zooms=(0, 2, 4, 6, 8, 10, 12), pixels=0.5, lat=None):
+        """Build the levels of detail of the subregions, one simplified copy of the geojson file per zoom level in zooms.
+        The copy for a zoom level is simplified with the tolerance of pixels at that zoom and at the latitude lat (see
+        pixel_tolerance), so it is indistinguishable from the geojson file at that zoom and below. With lat=None the
+        pixels are measured at the latitude of each plot (the lat option of choroplot()), the tolerances following it.
+        The levels are cached by tolerance on the instance and used by choroplot(lod=...).
+
+        """
+        self.lod_options_ = (tuple(sorted(zooms)), pixels, lat)
+        for _, tolerance in self.get_lods():
+            self.get_features(tolerance)
+
+    def get_lods(self):
+        """Return the levels of detail as a list of (zoom, tolerance), with the options of the last build_lods() call, or
+        the default ones, at the latitude of the plot unless build_lods() was given one. The levels are also kept as the
+        lods_ attribute.
+
+        """
+        if self.lod_options_ is None:
+            self.build_lods()
+        zooms, pixels, lat = self.lod_options_
+        lat = self.lat_ if lat is None else lat
+        self.lods_ = [(zoom, pixel_tolerance(pixels, zoom, lat)) for zoom in zooms]
+        return self.lods_
+
+    def get_lod(self, zoom):
+        """Return the tolerance of the coarsest level of detail that is detailed enough for zoom, or None (the geojson file
+        itself) when zoom is beyond the most detailed level.
+
+        """
+        for lod_zoom, tolerance in self.get_lods():
+            if zoom <= lod_zoom:
+                return tolerance
+        return None
+
+    def get_lod_ranges(self):
+        """Return the zoom range of each level of detail as a list of (minzoom, maxzoom, tolerance), the last range being
+        the geojson file itself beyond the most detailed level.
+
+        """
+        lods = self.get_lods()
+        bounds = [0] + [zoom for zoom, _ in lods] + [24]
+        tolerances = [tolerance for _, tolerance in lods] + [None]
+        return [(bounds[k], bounds[k + 1], tolerances[k]) for k in range(len(tolerances)) if bounds[k] < bounds[k + 1]]
+
+    #get_centers for data
+    def get_centers(geojson, method='mean'):
+        """Get coordinates for the markers to be used for the hover texts. The geojson can be a geojson dictionary
+        or its geometry index. With method='mean' the center of a subregion is the mean of the coordinates of its largest
+        polygon (largest in terms of having the most coordinates), with method='area' it is its area-weighted centroid.
+
+        """
+        if not isinstance(geojson, geometry_index):
+            geojson = geometry_index.from_geojson(geojson)
+
+        lat_cen, lon_cen = geojson.centers(method)
+        return lat_cen.tolist(), lon_cen.tolist()
+
+    #sources for layers and simplification if the data is too huge
+    def make_sources(geojson, downsample = 0, tolerance = None, precision = None):
+        """Extract the sources (latitudes and longitudes) for mapping the choropleth, one FeatureCollection per subregion.
+        There is also an option to downsample, simplify or quantize in case there are too many coordinates to map (see
+        make_features).
+
+        """
+        return [dict(type = 'FeatureCollection', features = [item]) for item in choropleth.make_features(geojson, downsample, tolerance, precision)]
+
+    #features with their geometry downsampled, simplified or quantized
+    def make_features(geojson, downsample = 0, tolerance = None, precision = None, index = None):
+        """Return the features of the geojson, with their geometry downsampled, simplified and/or quantized. The geojson
+        itself is not modified, the returned features are copies that share the properties of the originals.
+
+        downsample keeps every downsample-th coordinate of each ring (and its last coordinate so the ring stays closed).
+        tolerance simplifies each ring with the Douglas-Peucker algorithm: the coordinates closer than tolerance (in degrees)
+        to the simplified outline are removed. Polygons and MultiPolygons with holes are supported, holes and polygons that
+        become too small are dropped. precision rounds the coordinates to that many decimal places and removes the
+        consecutive duplicates this creates. index is the geometry index of the geojson if it is already built.
+
+        """
+        features = geojson['features']
+        if not downsample and not tolerance and precision is None:
+            return list(features)
+
+        if index is None:
+            index = geometry_index.from_geojson(geojson)
+        if downsample:
+            index = index.downsample(downsample)
+        if tolerance:
+            index = index.simplify(tolerance)
+        if precision is not None:
+            index = index.quantize(precision)
+
+        return [dict(item, geometry=geometry) if geometry else item for item, geometry in zip(features, index.geometries())]
+
+    #the layout of a figure
+    def get_layout(ptitle, apikey, layers, lat, lon, zoom, layout_kwargs={}):
+        """Return the layout dictionary of a figure with the Mapbox layers, the title ptitle and the map centered on lat and
+        lon at zoom, updated with layout_kwargs. It is the layout of choroplot() and of stream_figure.
+
+        """
         layout = dict(#the layout specifications
-                      title=self.ptitle_,
+                      title=ptitle,
                       autosize = False,
                       width = 1000,
                       height = 800,
                       hovermode = 'closest',
-                      mapbox=dict(accesstoken=self.apikey_,
+                      mapbox=dict(accesstoken=apikey,
                                   layers=layers,
                                   center=dict(
-                                            lat=self.lat_,
-                                            lon=self.lon_),
+                                            lat=lat,
+                                            lon=lon),
                                   zoom=zoom,
                                   style='light'
                                   )
                       )
 
-        layout.update(kwargs)
-        fig = dict(data=[data], layout=layout)
-        return fig
-        
-    ###auxiliary functions###  
-        
-    #reformat and reindex the df
-    def reindex_df(self):
-        """Reindex the supplied pandas_dataframe with the geographical subregions in the geojson file.
-        The geojson file takes precendence, i.e. index names not in the pandas_dataframe will be
-        omitted when mapping the choropleth.
+        layout.update(layout_kwargs)
+        return layout
 
-        """
-        n = self.n_
-        area_name = [self.geojson_['features'][k]['properties'][self.glabel_] for k in range(n)]
-        area_name_lowcase = [word.lower() for word in area_name]
-
-        self.df_.index = self.df_.index.map(str.lower)
-           
-        self.df_ = self.df_[[k in area_name_lowcase for k in self.df_.index]].reindex(area_name_lowcase)
-        self.df_.index = area_name
-
-    #get_centers for data
-    def get_centers(geojson):
-        """Get coordinates for the markers to be used for the hover texts.
-
-        """
-        lat_cen, lon_cen =[], []
-        n = len(geojson['features'])
-
-        for k in range(n):
-            geometry = geojson['features'][k]['geometry']
-            largest = 0
-            largest_ind = 0
-
-            if geometry['type'] == 'Polygon':
-                coords=np.array(geometry['coordinates'][0])
-                
-            #in the case of a multipolygon, take the largest polygon (largest in terms of having the most coordinates)   
-            elif geometry['type'] == 'MultiPolygon':
-                for j in range(len(geojson['features'][k]['geometry']['coordinates'])):
-                    poly_len = len(geojson['features'][k]['geometry']['coordinates'][j][0])
-                    
-                    if poly_len > largest:
-                        largest = poly_len
-                        largest_ind = j
-                        
-                coords=np.array(geometry['coordinates'][largest_ind][0])
-
-            # the mean as the center of the polygon
-            lon_cen.append(np.mean(coords[:, 0]))
-            lat_cen.append(np.mean(coords[:, 1]))
-        
-        return lat_cen, lon_cen
-    #sources for layers and downsampling if the data is too huge
-    def make_sources(geojson, downsample = 0):
-        """Extract the sources (latitudes and longitudes) for mapping the choropleth. There is
-        also an option to downsample in case there are too many subregions to map.
+    #the attributes of the choroplethmapbox traces that do not depend on the data
+    def get_trace_styles(glabel, opacity, ctitle, ticks, missing_color):
+        """Return the attributes of the two choroplethmapbox traces of mode='trace' that do not depend on the data, the
+        ones of the trace of the subregions with data (the zmin, zmax and colorscale are set with the data) and the ones of
+        the trace of the subregions without data, drawn in missing_color. They are shared by make_traces and stream_figure.
 
         """
-        sources = []
-        geojson_temp = geojson['features']
-
-        for item in geojson_temp:
-
-            if downsample > 0:
-                coords = np.array(item['geometry']['coordinates'][0][0])
-                coords = coords[::downsample]
-                item['geometry']['coordinates'] = [[coords]]
-
-            sources.append(dict(type = 'FeatureCollection',
-                                features = [item])
-                          )
-        return sources
+        featureidkey = 'properties.' + glabel
+        marker = dict(opacity=opacity, line=dict(width=1, color='black'))
+        missing = 'rgba'+str(to_rgba(missing_color))
+        return (dict(featureidkey=featureidkey, marker=marker, colorbar=dict(title=ctitle, ticks=ticks)),
+                dict(featureidkey=featureidkey, colorscale=[[0, missing], [1, missing]], showscale=False, marker=marker))
 
     #scatter_colors and colorscale for data
-    def get_color_info(series, cmap, missing_color):
+    def get_color_info(series, cmap, missing_color, nstops=32, vmin=None, vmax=None, scheme=None, bins=5, edges=None):
         """Return the scatter_colors, the list of color intensities to map to each subregion,
-        and the color_scale, the data scale that corresponds to the color intensities."""
-        cmin = series.min()
-        cmax = series.max()
-        sm = cm.ScalarMappable(norm=Normalize(vmin=cmin, vmax=cmax), cmap=cm.get_cmap(cmap))
-        missing_color = 'rgba'+str(to_rgba(missing_color))
-        xrange = np.linspace(0, 1, len(series))
-        values = np.linspace(cmin, cmax, len(series))
-        scatter_colors = ['rgba' + str(sm.to_rgba(data, bytes = True, alpha = 1)) if not np.isnan(data) else missing_color for data in series]
-        color_scale = [[i, 'rgba' + str(sm.to_rgba(j, bytes = True))] for i,j in zip(xrange, values)]
-
-        return scatter_colors, color_scale
+        and the color_scale, the data scale that corresponds to the color intensities.
+        The colors of all subregions are looked up with a single call on the whole array of values, and the
+        color_scale has a fixed number of stops (nstops) regardless of the number of subregions. The color range is
+        from vmin to vmax, by default the minimum and the maximum of series.
+
+        scheme is None (linear), 'log' (logarithmic, the stops of the color_scale are spaced geometrically) or one of the
+        classification schemes of class_edges, with bins classes, where the color_scale is a step function with two stops
+        per class. edges, if given, are the edges of the classes of any classification scheme, e.g. precomputed over
+        more data than series.
+
+        """
+        cmin = series.min() if vmin is None else vmin
+        cmax = series.max() if vmax is None else vmax
+        colormap = get_colormap(cmap)
+
+        values = np.asarray(series, dtype=float)
+        missing = np.isnan(values)
+
+        if scheme is None or scheme == 'log':
+            if scheme == 'log':
+                if not cmin > 0:
+                    raise ValueError("scheme='log' requires positive data, the minimum is {}".format(cmin))
+                stops = np.geomspace(cmin, cmax, nstops)
+                xrange = (stops - cmin)/(cmax - cmin) if cmax > cmin else np.linspace(0, 1, nstops)
+                xrange[[0, -1]] = 0, 1
+            else:
+                stops = np.linspace(cmin, cmax, nstops)
+                xrange = np.linspace(0, 1, nstops)
+
+            log = scheme == 'log'
+            scatter_colors = _rgba_strings(colormap(normalize(values, cmin, cmax, log), bytes = True, alpha = 1))
+            color_scale = [list(stop) for stop in zip(xrange.tolist(), _rgba_strings(colormap(normalize(stops, cmin, cmax, log), bytes = True)))]
+        else:
+            if edges is None or scheme == 'edges':
+                edges = class_edges(values, scheme, bins, edges)
+            else:
+                edges = np.asarray(edges, dtype=float)
+            classes = class_indices(values, edges)
+            class_colors = _rgba_strings(colormap(np.linspace(0, 1, len(edges) - 1), alpha = 1, bytes = True))
+            scatter_colors = class_colors[classes]
+
+            #a step function, each class is a constant color between the positions of its edges in the color range
+            positions = np.clip((edges - cmin)/(cmax - cmin), 0, 1) if cmax > cmin else np.linspace(0, 1, len(edges))
+            positions[[0, -1]] = 0, 1
+            color_scale = [[position, color] for k, color in enumerate(class_colors.tolist())
+                           for position in positions[k:k + 2].tolist()]
+
+        scatter_colors[missing] = 'rgba'+str(to_rgba(missing_color))
+        return scatter_colors.tolist(), color_scale
         
 
     #hover_text for data
-    def get_hover_text(series, round_=None, scale=1, missing_label='No data'):
-        """Return the hover_text, the list that contains the informative text to display on each subregion upon hover."""
-        text_value = (series*scale).apply(lambda t, rnd=round_: round(t, rnd) if rnd !=None else t).astype(str)
-        with_data = '<b>{}</b> <br> {}'
-        without_data = '<b>{}</b> <br> '+ missing_label
+    def get_hover_text(series, round_=None, scale=1, missing_label='No data', fields=None):
+        """Return the hover_text, the list that contains the informative text to display on each subregion upon hover.
+        fields is an optional dataframe aligned with series, each of its columns adds a line 'column: value' to the texts.
 
-        return [with_data.format(j,i) if i != 'nan' else without_data.format(j) for j,i in zip(series.index, text_value)]
+        """
+        names = np.asarray(series.index.astype(str), dtype=object)
+        text = '<b>' + names + '</b> <br> ' + _hover_strings(series*scale, round_, missing_label)
+        for col in ([] if fields is None else fields.columns):
+            text = text + ' <br> {}: '.format(col) + _hover_strings(fields[col], round_, missing_label)
+        return text.tolist()
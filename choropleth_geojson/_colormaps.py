@@ -0,0 +1,195 @@
+"""The lookup tables of the matplotlib colormaps, generated by scripts/make_colormaps.py from matplotlib 3.11.2, do not edit.
+Each table is encoded as in that script and decoded by the colors module.
+"""
+
+matplotlib_version = '3.11.2'
+
+#the number of colors and the row differences of the lookup table of each colormap
+tables = {
+    'Accent': (8, 'eNqrP1n/3/5pKIO90CYGJnthBstccYYd084znI+czrCcO4ABAMrxCzI='),
+    'Blues': (256, 'eNq9UtEOgCAI5P9/uIc2LjVQQJbWQ80N7rwDQ48T9aOyqCyqObU4cGMWWGwOQwo94azf31jPw6RzQI5NXmOOR03utRXbfkWvEb4/Q7wYnsZFfci1xsS5fVNPz2P2+38ohsd9JtFndZT4jK7PJvSZY+jFO57cu9bel2dxxu1o3vgILI+R5ULYc9vxiwd0AQGJF8E='),
+    'BrBG': (256, 'eNq1UVkWwjAIBKL38TDe/yZhhIbQpHZ56vNjOhuk2/NxhzBRQhoX5tQdxS67c4M/nTMj3smB5h97Y5ZCXMrCErz62+oNMnRs3eyHPvbyvA6O+3Gxl5w9H3i66EcPsg/nOyR/Y9hVHYAxFo2uQcmgbYa2i7bznq2znlVVqpZXNFZ0j+ymzLQO3ZT1udyLTCM7gDpXPZ256jXuoZ/An/GLHRMNCF5+xEmWOTYzrnfOs+wFBF5Oew=='),
+    'BuGn': (256, 'eNp9klcSwzAIRPf+F85PwsYSYIqKZySh5dFsf74/Pg8IfWhb3LnR4u6RZ+aW+1lkqaO9mGZ9vXvKN/fkJ5FJxEw5zmfpHCEcC68dWtiDldePVTN71XQWaf5Fm7zs85lO9v6k9tdi9nPUGjMi8TRGba8rhXVbipZirF7WdJ7Ous90Sf50ot2V27PllJ6jM/ndo2g8aP49b8zQ5MQgNPvpYAAsObD42j1zWuziO+f8A9wINH0='),
+    'BuPu': (256, 'eNqtUtEOAyEI4/9/+F62MhXQDjxzyXZnApa2GPR6vbV90pa0JT1RC2XfkcDz/qQb2Y1OmRfnmFjenzjWZ8cBc554c1122ps65ch9Dj0lIrRinQufJ+EK5uz0lgcW+oXRhWAe5j852Puca8G//XQN9zc9JPm4Hkp+PteJYWHBidntdMQpWPG2iHa5GO+GI/z9WBwVjxMnTffYcYsm19v/AVLaBLY='),
+    'CMRmap': (256, 'eNq9k0EOgDAIBBeo/3+xINJq0NTEmMhhujApNwBgRA0Z5mv/rxMQOOCRmZmb+a//+qtgUsiejpCWOQm3drxukWuZI++NDXAs0JFVDg4Ncl3lXPgewvfwhKXMHfcApHug5eZm/55cn387uwFvmHv9'),
+    'Dark2': (8, 'eNqTnlf+f9/BboY5ghsZinZeZ6ivncLQwPqE4cBpaYYDHzwZAPbhDjI='),
+    'GnBu': (256, 'eNqVUVEWwyAIo/e/7P72s5eMKhZQXFf72oAhEen786Iu6Y+uELcv67jndbz48HJYfRoXWKbKpBWrD9kDfe4r6r0XR0x5vMuJYM5nn196JJ2Y35GQijAecnRcOMdbjy2n2HoIZ8xnsfBg4TG0k9fpnTxCTX91FrDZ0OYF+zeDDzXdh1ZT8b6PP2qaH9Y9bnrBXINat7+Lox4sPgjINShiDMzjW54P/ShfBrL22A=='),
+    'Grays': (256, 'eNr7/x8MGECAXJoSvcg0OpsQn1w5YvjYMCE1lMr/+/cPL5+WaoiVI0cdqWppaQY+M2FsUsWoYQYp/qWWOAgDAHEWpx4='),
+    'Greens': (256, 'eNqlU+0OgCAI5P3ft/WnYcmHkIi6shVwHHdp67yO8iyoV10Ui68kTzj++YVj3pZ7fIglffgzLxEp4gvH1l/jGHTR8bwPRl/SFC2nr++knD2+eAc+45EPFBtvF6NPWuYY+fcY2H7oBpfHGkJ/PbPWsBqH82NM9zfjVCzdHxjGB8P/BQ9p3ve62vPYbNLLNW8W2k59'),
+    'Greys': (256, 'eNr7/x8MGECAXJoSvcg0OpsQn1w5YvjYMCE1lMr/+/cPL5+WaoiVI0cdqWppaQY+M2FsUsWoYQYp/qWWOAgDAHEWpx4='),
+    'OrRd': (256, 'eNqtU0EOwzAI4/9v7X03e8tiBGlhaaVJlQDbOE6k8nWQhJnx87GoaPDEt9yov71ZndX1rsuei/9m/+KVewvNXcwS5/gWG3N40DEoC5QLJ3zRNNpqb6OhchKRdz6TqudE4r67FruaM+/6yi+4eS6VafajalZPeIappbSWevp9Sg/NqafexvXI2lNFgz/n7cIj/qCl3un/wb8BrRnujg=='),
+    'Oranges': (256, 'eNqlUtESgCAIw///1J57HRlRIFLq5V23ARvQKe8b10NE9ZtC6vMr2oDNbIZyOF3CH91fz11H4HivYUE79EYe9l1BxPycl51WOM47sR7s9KxzzBO0cLqsP/Ke11UZv+rUxrjjD43j1tN8vV5+V16wrnaOaXOKaU5GlCTXou/dzyikqz6IQSy+Gc0gZip0ADs83Lk='),
+    'PRGn': (256, 'eNqNjVsahSAIhLls7Lyf/S9HCAHN1C590Qw/A/3gr4QERFZN3XP33DlPmWA87iZb7tViAiQE5PRs3nlj0Xef+ZaN/cEv+5mn5O5fGM/snD0zvKh7xO3MFafshx2or82BQquFvHX6PYu9HWu3wtdHQazyq+G90+aSDbPI9q0+k8tuy5uz+VIg3/mHbNECRUwldekHf5t57v0/xdSZptZeU+v8hmfe2csNsRsqc8mlF9ll1txTHSk+Z24='),
+    'Paired': (12, 'eNoBMADP/6bO4/95qtEAk2fWAIHBogDI+m0A6ICDABqlUwACwJEAyzPWAKCLxACVwv8AslqPAGWYFzI='),
+    'Pastel1': (9, 'eNr7vWXd/x2SpgySco8YhB7IMyjwHWJgVFNjeHbzI4MEkz7DVwk2BgACyAvW'),
+    'Pastel2': (8, 'eNoBIADf/7Pizf9K698Azgg8ACn1/ADyK+UAGf3lAPLwHgDb6gAAJs4QZA=='),
+    'PiYG': (256, 'eNqVUAkSgjAMTIov9GH+uFmzabEpUNSRnT0nDL70iaIqRUvH0Nuf+W1XVPRRGrYDLzP9cTe08D2lZaHZXXp1X9bet5I6suQu3uPMZ/eaWeZstb3J4SfYNbhPmoxd9x16ft6MHVIXfaTmzJ9xEYxocp40Vpt1bqgzpPqZq8wmT8Zh07LzLmBkC64YunXWskvf7tXUDZ9uhCb4TTjo7j8afY95/613jdD+zznCk0Gfc/lxx3t9n3JmbykgTbM='),
+    'PuBu': (256, 'eNqlUtEOxCAI8/9/+B4uaW8IzqJs2XLGhAJtwWz8fHmcdtx+GMACA3i0qzwv1rzsk3nuU/EYHhnn3bw3d6HOvdMnza43DMXCLXELfoHNEzK7xF2j3Dkf0kfJpffatR6616LHsgviXWPeGWWHXNtzKm/zKmqRU7z4Mqr+aVx9OD6sveTEnHjNO8ZF/SWv/0twHgZ/7PEM8w+txR+7Lfuh'),
+    'PuBuGn': (256, 'eNqlUlsOBCEI4/4X3o9N6CpWrQz7yhhnKLUFYsTjibas7bYYEejAsROe+v+9YaBXsI0ctvWTt4rXXoVHa1nmC40rlh4lNuoL3Gu69ClxeLbW2d9N4zuMkdv9cxD3idY8aa7MfczljuadlPWZO5y4R+eMDSP+m4+aHkg9Q4sLD+aHTzCkz3ggjHA+3Ir/RZPPv2hdztYjw5kv3gvuhq59LyPe94w='),
+    'PuOr': (256, 'eNqdkEEWwyAIRMG46J16uJ5cpqBoiJq81y7IZ5hBk3zeLyQGJaZ9pd0cD97Dns20sZ6N3l9nlm3k6Gvx6FuGw3kjk47bSsaj67x6vY64l6+eF1lxbqy9MTuDHn3Id73Lu7Z79S83rR8K506D7r2L1tziERNAJPowQpz6kMrWd0+iRtByziX48DPEzrX9mfhxXt8P9+eJ1H6wTNpY/s+hZ0sjStTqL97pI+Tm3cWr9ylhLBNtXvyd1tnJ513TXykWeoc='),
+    'PuRd': (256, 'eNqVUlsOwyAMM/e/7qRpP8kgdqnp6KYhUB62kwh4Pl7ZF/qulXLKjHwFYyetEguf+w+e1T3ySVGG+YMUiTmfcGIrPmsE8+5PvmmLb1pYD9f5bAhc+PIXvvckttS22TD7Aa3bOsoP28RrilE4LM8Y0i28D8z6bHrwBDE7bVyax+ItcZ65VW/1cq8fj1Jvw8vtO3hwYPRTvMpBGvl73YlvdXycPkJV1zhVrbBQzrHp61/HTyz1PRxjj4lRKau+5l+xvMHvOfFFm3gDh4D/lQ=='),
+    'Purples': (256, 'eNqVUtsWgCAI2///cgXlBR0KnpMvTDfGtO7r0W+hrFa01wrLjrgGdHCTUNYrvF+kH5q5N95h07q5PSPj4dGaHbY5jE1v89ifz7KKnMcPra8TVw/RlHdYYn7LIZkXV58ZJ83xfvweq3bPxfcF3Ylx0/W+CAvNE93fUSwLzdwwaxDkQei9fi+k/Qcv6xX+Dxb9b02UZ9YXEvIZ2g=='),
+    'RdBu': (256, 'eNqdUVsSwyAIRDxIj9f7/1e2INTBYCYz/SDsyx2TvOkFJqLebNrf+6mDWTOdqSlpCbPxHpwT/nnMVQvdMV86eGot4aIH986+eXzI1Y6uL2RjWsWWo/7D7hX81KE+9NupsAYJOw+fz/6WiVzp0P8m+lgbICHbxpH0A1fm+vWc9WHl7MwQzPPDchqce3LNC2545CRhyxROq9u8PB+5alIy59zNxH0QMzESDu6YXMdDPu6/ZfSekLGNbFz9MUpmy934ueMLLh5hpQ=='),
+    'RdGy': (256, 'eNq9T1sOwyAMc5yD7Hi9/wGAkQJS1nRjVGo/LL+CJTa8CgGoGOQyzzbIeqOEVCNO07x2T6dHR8as503zsME9E6dD3n3b1I+OJ3dxQ+uHDJZFbXfQoVsX9GzDemEDPevXTI7Z8L8yCEopyDnv7PFPtvruCb4bKaVTvdLNbkdmf1rllb+8AbO7fl0='),
+    'RdPu': (256, 'eNqNksESwyAIRPn/3+2ht91WBQqIqc5kxLeLbCbh+8XvErFnLD/PQ19PL4UPmtf13qCx86Y8DUvz/vXI412e33wItXEUT+CsHFLmVpbn0Grwx23e2EHvJ+68686D3ng5dp+hUUFlojqVr9p51x/4TT+w3g06d54nD7r7RnTz03NmJqUn3G0+zYPxD+snWnEZ6hNj0Xd26su65t60yrhlYZrXs5veD0CYv8I='),
+    'RdYlBu': (256, 'eNqdUVkWwyAIBLxLb95j6hQMMZCqXT7mzcKERPOkB5iJRDb4NP+iw1oYKKyZsaQszVJ29aTcZkFL8Q9xb0z+/FvetYROZNl3l4flPy5onvf32Y9huSCn5knmefKxs9hFQlA0HAwUZ836rHSdsnsn+GNX9obaSHMo7jzPKn7rm67GLcB9HZrms+BPXSd7Dq079DDpPQb9YHTdUmaM0WsjO4HRyzvh++ziEDz6xSyyjZ/tssO8ABbARQs='),
+    'RdYlGn': (256, 'eNqlUAESwyAIQ/zLfr5nlgyVbsA6dVu9NCQBtb3TDaUQMU+wyjd6ijY8UYt6jTl4IQveq49rylzN1S5iujHZ/Jvfa3Y9nnneGz72ql7l67qMnxax4307p4/oAvStABk3TYl/zE9PAEOqCX9mwz96TcpkrFpODedfaEGcy/t4LeOsw2Y+6u6RyyY6zbf7QSZY5Ts9etYDLZNXrg=='),
+    'Reds': (256, 'eNqlUkkSwzAI4/+v7aVXqbUhtoip26SZyYCQEN74fPD9mbXfIl7O7XbvmE3kCMWSI2v5oV77cOuVMDbrSX077rvn3L/yBd5xf+A+H3EXp9jq/arApK16tL7ytvKSO2Qc1cQ5NrnUYGsvi14oX2vgrzGeMn25J9znW8YMjJEHP7QTT0+K1veEOGL8iA8vr1G4a7g5vQC3N/qC'),
+    'Set1': (9, 'eNp7IiXzPzhlDoOY4SQG7/mRDOmGsQwMDcYMy8O/MgRqT2dYJHGLAQDh5AvL'),
+    'Set2': (8, 'eNoBIADf/2bCpf+Wy70AkRNpAFrq+AC/TpEAWQHbAObrZQDO7x8AC0UPGQ=='),
+    'Set3': (12, 'eNoBMADP/43Tx/9yLOwAv7snAD3GmACFMWEAfQOPALYqBwBJ73wA3Qz0AOOn5AAQawgAMwKqAPwLEls='),
+    'Spectral': (256, 'eNqVUAESwyAIS/Bne+h+qgwZttT2dLseDSEB1DdfKgKIEFICOy9ECZz1Mvkyljwn+yzoqI4cSD00Jk1Cu/DU8zSre2D7YGdhYOf0i0x1zyV5MsraK+GRmHvLd/o+5/koZ/xS+7cPhKJZ2KcT9roOfKrpT72wf1WgeTByOq+B2zoGX/fUw4PnvC003Wu+sxo2fqPyzGe+0uwcK6/aDrHFI1hTPup2mSvXG2eaceMWH2LFEl4='),
+    'Wistia': (256, 'eNrdjkEOgDAIBNdv+17f0ZUWYrEhWI1ePA0tOxs2rgQLgIKFVELY/iizkMb6tv+6b7kZz/mR53tHz/em3uBHXnSPenqaekYb+2w8zUn+2L3cm+afuOiuJ5Ldj7LMsrzZO9N5xS86E+4bEN57'),
+    'YlGn': (256, 'eNqlU1EWwyAI4/733DWSORQNaN3e2wc1EBL6LCVfJGFmbIH25MTmWXAt+IVXPW/8qtE9beBQC/az4g9f+nzmTS+agx5c9cCQnoSHL2QGwlP5VFszXcdxG8UP0gPRHnHV/uMj7xj5znVN4u3Qm2bsfNx31D2w7mrlEda/banl/OBRatnDkhdmzWR3rPSa7Mczv3bqwrP/AWMRbBa2UzAunJ74oWdwb5B0JIw='),
+    'YlGnBu': (256, 'eNqVUwkOxCAIhP+/cB8js+I5KO1m01AZ5rDRFPgAMEF9pL2tLgi49WsWcdOPrs9uvLN8FjEwUZP3HRCxry0V+q77R0s658rQ9FIpSDBpyvAFHPju2/3039kmT1jJFzm8cKmP9mcOXJbM/H5s49uDnDPyM2/RvwiTEKL8gUaXWEuT2fKADnfw+rCH45AF0hz9ygYfXN7rjyzhLP8fZgn3WL2c3MEzF7VIfKSt6AueK96M'),
+    'YlOrBr': (256, 'eNqVUNsRgDAIo/vP6RgSa4s25uzrg2tIQuAKHDC4maEWY8sY6PTh++05T3vOz6shcxjgqR75K/jZWfheneH1iW8wu1T5Dodg9Pmu12UufIM8FP6mqg7B5fXwCK5aeARr5rPrN5OyoRy/lLGlDbI/X1rPbJw1jfWXK3r6+PfzUvOZ+Ez2su/l0v4sZVzxH9yf'),
+    'YlOrRd': (256, 'eNqlkl0SgCAIhLf7X60zsUVB7hhlPw8O8LGLjkrOBA0gAWRcl7OMJybaig39zcNy5kWeOvW88VdnTJ6zTHKP1uueaJw983BjiB6CS/2Vb3uMObM2jRX726s1NMa1xHlMv2PmLe4eYScf5Wv2vraXfoXjaTi1K/I8OSbRKd/roT945bd1tgGXize9v3rXLncirLU='),
+    'afmhot': (256, 'eNpjYGD4z8TAwDCQmBGImQeQzwQkGIGYmQnCxoaHqzwjLABQMDMSmxGPHDZ5UvWTageV9TMipwoYmxlHKsUlN3T1AwDyfQP9'),
+    'autumn': (256, 'eNr7z8Dwn4GRgWFAMQgwDSAfl9hIkidV3aj+YaEfAPYrAv4='),
+    'berlin': (256, 'eNp9TdsBwyAIBNl/ha7QCQOFoOQkST/Oe6qfr5qS0eEIVgMduYH2c+uX9heO8rqzd/mO5s4gx0yP9Drz8v7ymU1u3rSzAzp62JDtGcG90iuHbb1lWjuavnrDrc4t/gtc/fU3bjK3yosX1MBbMZe/dDAH04Mma6CmHZx6gF4YTLs/N6DbZvC+S+bmg7n8iJ7XLnVmgDGaDx4kk08/NxJ86smrc0hlAWm7Dtk6xjv1h9zvNC23v+Tvfml57S8Wed/8AIkuTmc='),
+    'binary': (256, 'eNr7/x8MGIYC/vfvHwMIjOqnrX586kByIBqfOcNBPy41MDl8Zgwl/QAOyLwe'),
+    'bone': (256, 'eNq9kQsOgCAMQ9ve/84qmOg2ZhSSGUIYe13HB8AGEKSduuNjIObs/uIPGscTTecq6t+oivpn95vtj75CHOtkuMvR1yu8r1jr73SmPu0R/P8436x/+yGTl1vX+Rl/46PvOvfaN07s4H0D/Q=='),
+    'brg': (256, 'eNrVj0sKwCAMRMd4/yPH6RRERETqwgYXjzC/RQDSUBBJEjlQzz0X/DnvPa+XR3MFKNbx6jx4O2jv2nPRcVvkQfvm1f/Hzmd92f4BFzkADg=='),
+    'bwr': (256, 'eNpjYPj/n4mJgWEgMSMjAwMz88DxcYmNBHlGhv8MDP/+URf//csATFZDSx5dbITwAYBpAQ4='),
+    'cividis': (256, 'eNqNk1sWwyAIRGdMV9L9dP+7CVXwgahtcg6R4Q5gPoL3R8AEgNBTI+dIQ3t2qndWeg2V50WLK+dXOSl6qps1INrWNCtj9uoWV7fc/E2zzms5p3zMXtmDPL+8xs8eLgyRTbOLtuLMGGYw7Bp7FtY1191xX5i13s199x8+tDznk0f2+tjntRx8spm388rkT4e66Q0LPHHjhWz6pe5ygaB3Ho3b8dv13p0nlzeNrO2C9q9+ARz+RRs='),
+    'cool': (256, 'eNpj+P//P+N/BoaBxAxAzEQM/x8QM5Cgnkj92PRgdSNUPzF+GGr6iVb3D0ozDHP9uNT8Q2IzDH39AKW06/4='),
+    'coolwarm': (256, 'eNqVjMsVAyEIRZ+UlRpSdPpKBsKgCKhZZOF5v4uP50taa2hEIOrquY1MOR/Zpjm85eWG5m3e/X8cufAI/mYKj3SH8TfqnWbnNm83wdUOtVt87WTZZffI/eCRMvwPCda6Pc+7nA+e3IP33XsZXviHdg/vpDKQpPZfdDeLpIU1rZ2x7Gx0YP8n/LoJ7922qcrQO1s/mbpPZZn3wpXze5mcPlm7tP3h+ap9z6NTz85f3LcrcbYr91b9yFn1fQELXVPr'),
+    'copper': (256, 'eNqtkVEOwCAIQwv3v/MW1CysC7I1+zDNU8EWARwGwCyWDXXYnUNRc6iHouFUx3z1TXWe+se9La8633G8iz0r+dm3kp99K/nZt5KffSv5y3l8yM++lfyPeQj5p4/6b9fhVDQ8thr+s+5FnxPgwANE'),
+    'cubehelix': (256, 'eNptkwsOwzAIQ23a+x95LDG/tJsq5GdKE6QCACcIo6F0P+RyzRnb8fArkPmH32rjI8dgm9w67K+6lFnL8JkLxuGLMSyFclu9veua4qhzXbX1ZKp2VN+uiJa8w+wTWl6t+jNwMnAlX8CPXvW+WH4rxzez+W7eYcNuR27Y2l+qseRT8+1Uc07pk1h8i3Vr6z2eUQOO36zOiy1VYc1u45vXj3D54tHOyTM5Z4cHp/prlmrGPOeq+TVX/zhmJVp8e61AzWDOCYkJe+Z6DXAwiW4rOVqjdsw6r61s5cNb1hi+ZrBC/Q=='),
+    'flag': (256, 'eNpVkmlPk1EQhR9FDIuiBAKKGBAiigsS64IRtSylFOO+R6P8NBfiGpdgLNCFojahghAlIgpuCGIgIAQUCIh43peLqR/mtp2ec+fOMzMP81TvhpOVUOSB1H20jUL9S8UjCF8Fpl7paFDUKZ6yVafUSI1TEXN0M5x1w0Fl1pXQPbmchg6pn0DoOkz3f5TKp/AqGslikgrjL1MkFWfCBZd+VEFuGQNzyfjfy6+SgRoY6RiUKmD8AVIYotz45SJjy2q4pJsq5c93MR67nuBn+RtV9Tb0hn7ZdRf8PuL4RInx69XkpcfCZWWOKFPoZm5FPk0D8ofF4B503peIJtO/xeE1xYaBFY5lOqqL4IT8e5VJ2UPLiLwv5HgIEYvh7zYd9SbC7DC1FxlySlTPyFusTIaTrp8xNAh73eMFhrOD3VEzCJHDtM1QHVOqSCzJgvPKlMq/oYy+2ST8XepY5YJiOPZWDeE3/gBpjNgMLb/1mV6QIob65pZ/k4vRmAyCGps3KNct6A+PSxU0fh8J9Np1Lb/1jtzMuAWGh+UvcDOTkEfom9TP9Oq78K52LoqhxaCTQ1EzKIy3GIrqcTHYpUh20DwsdUTqB9BqMaTFeK07IuyMmsEB6+9zonpat+3XrWucvJmQul3qWlW+Bn9+dP3HcCOz/2Zg7UO8K2eBoVNdZZXyZSYRX6fUkgdvwERPn2HotVmsZczeP49hmOpIg4v65pI/r5zhJekEPsiv1fXfhO+RUcPQa9+zkn57/z2GYXZ2ghiKapX82yuYissl9NUwvAM93hn73Yt7uJR39u54DINtSTquiOoxZRzqbFUhz4fEoFmhHW6vsSA1R82glb+pO+AA'),
+    'gist_earth': (256, 'eNqFklESwjAIRHfJ+KPjSbz/9VohQEJj1A+GZfNCp9sCOIEXiCeAh3ar+9RyA4TaATa1rXfNqbXQUrPo9P0+YsfQ1U9+96zqJ8941oUJzeIzeS53VceOwQyeV4YakRZxRI/ZfPW8L3Pl4t5geJSzZffgjsJvdiSz26GzMMo+gb6MR8g57zyY757HHzM4PcvRI4LHw6nHzsX/xcAzl4/dnH7VK1N29Vhs30lEJL3j/HZWdN6v/Bm8JwBLgPpTSHTqT9p95uxaWLzKlt4ZKZ5cu9jZn9oyrZy3mL+U3X8DbMtF8Q=='),
+    'gist_gray': (256, 'eNpjYGD4z8jIyDCQGASYmJgGjI9LbCTJk6puVP/w0A8A820D/Q=='),
+    'gist_grey': (256, 'eNpjYGD4z8jIyDCQGASYmJgGjI9LbCTJk6puVP/w0A8A820D/Q=='),
+    'gist_heat': (256, 'eNq1j9sSgCAIRAHt/z85EWtEIy8NPSAwZ3dYAeBEACAuz37P3nzm+5prNc+uf+b7uy/d54eodJlD3Qlbnlmz49iPqLSWv9M87isuYYP6CBmfszQ4YBIqsiaWniscdZYwijfM4Nv+S/Pq77izPwEgkgP9'),
+    'gist_ncar': (256, 'eNqVkmFzgyAQRJdGtP3S1v7i/Ok0gaB0Dw4FNZNmMi9vb2+cERU4Rwy/wHBF8rta5jovO81+BNw3GTO+5KNOe7nmU8Bjvg66D2KVTrEbLznSnnaEBg061ibRt0Yxz4bLalN73/V0z36YmAMSg3iqsljnZn8C3gpdlR/OJ9LBks7QPLT8ah912YH/ofFRt3iiZzLxRmcel/qXUza0ec03XneLLdf4vLsjE7DmpzO/wfDDIIzqbd7Pjs/f8dk7vgvHd7K133URro/oG+YlW7Ftu4JJ37KhTcqGGWrp1ow8Nzm77JGy7qos+z+76sDz'),
+    'gist_rainbow': (256, 'eNr7z6Dxn4HhNwME/2LAYDP+ZWBgAzJZGRA0MptUMWqYQaTYf1aEj7D4jCi5gRTD9Bghjw8i+T/MhAOc3EghRo4C/cz/8SddcpM3MXKU6mdi+ENSoAAAVfh2vg=='),
+    'gist_stern': (256, 'eNrdkFEKwzAMQ2U1F1h3l97/XgnrZLKWxGspK4xCPx6x5MgYA5hHIxaeTR11Wz9EPkmJHgyZwyV6EiYgj/LsoyP37b9EWYFfhwVcvdz1j7TnyXNZ10D5c96E3yEFqgeoZtXc+AO9DJmurzz5PXdf917N/5bZ3t/3HA72T3gDZ25w/Q=='),
+    'gist_yarg': (256, 'eNr7/x8MGIYC/vfvHwMIjOqnrX586kByIBqfOcNBPy41MDl8Zgwl/QAOyLwe'),
+    'gist_yerg': (256, 'eNr7/x8MGIYC/vfvHwMIjOqnrX586kByIBqfOcNBPy41MDl8Zgwl/QAOyLwe'),
+    'gnuplot': (256, 'eNqVkNkOhDAIRYGq8zj//6nuQylSatFk0lzPYUk1AsD5hQk+nJEzsA3CCZKGuFc4GWvGsEZh6y2HgCXekd9ImMylFpLVxYn3yBzlXOSDl4EjB6G65OTeWeiDh/qhfvB25q71rr6bg/im/U194766cDWC+Kq9QrB60XqpNQdsprXzTMD5Np/dbCnfq/8gP1ADWP9P178cHvre6X1HSLc5vcypvTfs0e0eTz/z+9Es2OlmAbteCnZTO+92/2Fydz7VAXN+CQk//g=='),
+    'gnuplot2': (256, 'eNpjYGD4z8DAwjCwmBmIWQeIzwzmwURx4UEjz/iPgZkJE7MwYRenlzwTEDOMYhpjUArgBWIeAjSMTUielwEArpGC/Q=='),
+    'gray': (256, 'eNpjYGD4z8jIyDCQGASYmJgGjI9LbCTJk6puVP/w0A8A820D/Q=='),
+    'grey': (256, 'eNpjYGD4z8jIyDCQGASYmJgGjI9LbCTJk6puVP/w0A8A820D/Q=='),
+    'hot': (256, 'eNrjYmD4z8zAwMAExMxQzIRGj8pTX56RaQR4drC7GRwJLBRg5iGun4UBAIlhA/0='),
+    'hsv': (256, 'eNrNkUEOgCAMwCqg/3+vwHBEjZ50JGg4NBzWkKUrUJiBxYDV6+yKziXooop4SMrKM5F3p9Vt+VPwGjbou9Mn1hcHOLwcho86ZXDpYtSip1sv70g34k9R7e4GWU+JFg=='),
+    'inferno': (256, 'eNp9ktF2wzAIQwVk///HYTYIBzvZHlJJV2C3JwXMAQGg43OoKL2Fl+mLSfLQ1k2mK1uoUmevIMPeKe9RV+jKdH5mYRbSMyO9SP0S+sGpMyevWbD/j+36yeCv+TzD21n+nm8zsbvmi9WOf3cb83VPeucM9ozG1xmpz86h2Fl4nXq/9v7qRVuv9zO/+D2+0MH03jJmbh2q0/kXzg51b/k2V/uQ1gUHz08fmfq8wHp5+qF8RPc8Hldr2UY+vdFbm7dd5WK+yJrKRV7+J7xIZqGX5jWyhf4Cg+psng=='),
+    'jet': (256, 'eNrdkNkKgDAMBKdav9sPN7VuvEB98PbBwjBJuwQaqDNUQOSYn8gGFif+Fa02mkgUouwx4lyLUqA73BN7/ZeZ9+a6N5kkm9OKfnUEGSeNXtdX357O3ZyRhb5O47bR3jNgB30m2wEkv7N/'),
+    'magma': (256, 'eNp9koEOxCAIQ0v9/2/mVEBgmsuy66NQlnkDhgICgPN3qtC4qEyFq1TdPJJbbxwmer0yjOzujpNl9UC/nNV3rbyTKJGXeEbOLZUlvPlmwYKmXEewezBv1eHD6pUNtlzMpt/z+ORv7+7pveuo9syso2++tj3Vsx3qs/p5Vp3VnK1eYXs/9X2f+qjtSA/JVO9hMwuH4rDvYXyi6YNF/VC6L855aMJyYI96LZLg6+b5cyXq2hfmXM08e9U3VvLp4+nT57v3f5bH+wEzji62'),
+    'managua': (256, 'eNqNT9sRwzAIA5btuJ2oVoKNecW560cOSUjCwfeDMUCYH805+W9hQLlh8xz924M/NLQsKPryPRzegJg9O1D7Jy/+dFs7T10F211Ed3QuPBKOG5UPpHtFq7uqcXBqunMmUNKI19t0kuUNv34sd3JjncZvXTmRTeW6Y8vM/Zq0987jgzRNwk+2Y+n7NVl9xcOmR89T5+d0L1sXl+xTz9nwrvfwqy/2+755HSdv7hD2/3W/ZFxvF735vUt6lxzyTBdoMS10'),
+    'nipy_spectral': (256, 'eNqtkeEKgjAURr/NQGaj9P0fs5Qiu+uzTZpR7Q5Czs7ZDwXvBRAcOjjseUaXumUZPvbLGWvbN3qkp6d1LdgBtThEOui6JU3CKtsKmQGT0LS588UVyfr9nrVM3M4Y0XS41v1Hqf/4rQN1xMul9oHbXJBkRTcSx2yTtY25knOB0/YeLj+3/LEXh8yahvccICc4DEDfq3gAfEyTZA=='),
+    'ocean': (256, 'eNq1T0EOwCAIg+q/9/M5zHRBFHVLdiAV2lqggxIlJjql/sL6dnUkCKUrveVX+lXv+vNcaYZ7C58wucv4uRQqCs9QveIqDxiPxg/+V/m7ewzQ83ueXb/RQTBwKXhIUmhn6h3RetDpSDQY/p3z4zQ7452PzfzQ3eXnP/su7o8v8i/q0Fj9'),
+    'okabe_ito': (8, 'eNpjYGD4/2w+A0OB6EuGVa+6GD64nWcQ6CtguPrGj+G79HIGAM3EDOw='),
+    'pink': (256, 'eNqlUG0WwyAIS7Brb7H737JV6QcDdHtvPzAhgejzDezLuuLVats6LqWg1OooonVyaZxUdL1k6Hkt+t7M0Wm/YNCA4Hsv+FX38yHH7DLLsv5ktnNhE+qlqteA3iqqDjqNZu/mbp/q0+4PtNuTRLtyP+bwvONEkAPN5+R+NteO6F88ycGXezDWqZ/SPln9CVcUw/2szaPZi9pcH2X/y8W9izgAwBMD/Q=='),
+    'plasma': (256, 'eNp9UssOgzAMc7JJu+y7+WyyFVLHLYVDZMfOS9DvZ4s3DK9weMOMxj0SVxEYcjuwNBPfMPE4a439yQMyp7jFQsuZRh3cP2tEk9waRiIE46g7a0/eNfemq5b9k2YufPZ6H2f1OaNv3u+48x7Ca++zPwcGH8tePHjHDxw0LO7Bcgeyf9UL6vCrD7kbNx5kX/HaqX5pGHOZCelDfhfNcakTn7y04AMOPtgYeD3kUI25sSbcqLOGXp+7/3HHD61Lnwg='),
+    'prism': (256, 'eNptk2tPE0EYhU+QqHwoJWpARdN6A+ltW43xEuNd+pe9o0ZBo6FXWrogQukXmhDFhEblw/rM7GCXapOTbd535uyc99kJpEDmdw7lUQHl0DRKSJsjUpm/JVRlZbMjrfs31as/onGbhidVJnSK/kWUwS6vFjaf5OmNDuspVTaN8mCprrhnCl2Qeif6/hW09E1aXTujbnOWwj0a11gwpdj2kD3ijD3eFv4V9E4n9YLKgo1gPQsuRxZNobOSPxz6G9V+S6221G4VtVd7QPEW/lkd8uNmqd2S0U9smuiD0pqjYjL8kCYiM/LcYTjU9ujBDI0tae1LSt+XHtO4Q+MqjYSO96Tz9NN2+wY2i9i9VVzPTXJp2PnuZ8igSwA6Hfoaf/Oe+q60sh5TZ7mooGoyXEcpHekcNch02c5oB4s6VvO88xWVJ+GMkhH/nFvMps5If0aG87LhvHJDu4ZzyXBmQxXOwSDnzxz5NZyfUd2UYgMzSvc5RzNYzl8n1W0Uadx1nKct56QbracuNmXs3vN9Gc7zYYYZ51/4l3N5gPOGP6u96kMacC5lNOSP/eWc1S+8G9h8JM8+5x1pPOKfi3COD3DuwnnVca7AeZGPu5LUsZ6NbD/HvNqWswfnMcu5/n/ODDWYZMSRGdUOcL4fci7DmUuZcFc0x3dZUA0twPmlyxCEnKP3OcI5ep//AIpWzVI='),
+    'rainbow': (256, 'eNqVjFkSwyAMQ20n9+7Fi1TSAeI44DYfHi1P8BISGwWbzG+XNevv9kX/T7bIPeO181vPLOwvyvOdBVYzq1plVr0d3h545ZnVMQ3ca99p7BtTrk8WOdPox2HSBU6XuydCdlsuMpOMHx5tD9fffFO4DlnXtEC0qnwPIqXpkcsDLe597Gd5aMYm29i9EzY2+d8fWoN+Dg=='),
+    'seismic': (256, 'eNpjYPD5z8DAzADBTAwI9sgQY2RkZmBhAfKAXFZWBjAbGx6u8kwM/xgY/vyhHP/+zcDw9y/5fGrYTQYN9P2IxgAnL8B/'),
+    'spring': (256, 'eNr7z/D/PwPjf4YBxQxAzEQM/x8QM5Cgnkj92PRgdSNUPzF+GGr6iVb3D0ozDHP9uNT8Q2IzDHn9AL2k6/4='),
+    'summer': (256, 'eNpjqE/7z8jIwABEDANFgwgmfHwgYGIkQT2JfEZGJDuwuROmB48/8OqnVJ4O9uNVh66WCvaM2j847AcAjUIDZA=='),
+    'tab10': (10, 'eNqTL9/y/wFHFIOuohzDqvY/DPscpjL8eN/HEK5YzjCHYy+Drd1ihmjGtQwARXYOpA=='),
+    'tab20': (20, 'eNoBUACv/x93tP+PUDQAUbgmAAA8agAt5bQAbD9eAD5IngApcW4Alc8nADFJGADHpnYAOEZJAB/bLgAUPxAAiMmtAEhISAD19lsAHx5rADzjQgCHHBYAChcYXQ=='),
+    'tab20b': (20, 'eNqztK78LympxSAppcNgaMDPcPx2NIOmpiSDpq4kgySPIcO+SVMZDA05GLRkJBkYBJ0Y5hYuZdDkFWTQlFBkEDQ1ZJiy+jqDloAig6aMJoOAoSQDAKGLD1I='),
+    'tab20c': (20, 'eNozbNr730pHksFYhptBQ5CPQaFKjkHcQp+BQRGIlcwZTC5vYnBWVGLQFVVlUBNQZVjX9JFBU1+cQU5ZhEFOlp+hs7OCwdjYmEFdXZ1BRkaGAQB79g6L'),
+    'terrain': (256, 'eNq1UlsOwyAMy6M9UU/bq04jmQV0BQSITepHZBPbBKQcx+kmQq4a628u4Dr3WPStZ0neqNejxZixMROm0Q7cykLv4oram17p++qdbMrjfuJutrp/MOOp97ETmTlZ8Bsjt7rX9bSYMgHlo5xlfTIjWNYHM+68L+StPz+fmYUEuyfYQcHOMXZPNXERyaiVZ6Yt5a9+wRmawpOw9UPHWX/JNx4GaucfH1avAgw='),
+    'turbo': (256, 'eNp1kElyA0EIBFlGss9+ie/+/6/UYLamGS8HIrOqUYSYz48vRX4D5HegYA09yyefAM54e1T3sM6cijVAl+WrHZkjZ8+W3Tk8SeWT1FTCygjKNqaH0BRSoxohyZIdGaOX6sTek+mrfNVuUiPfHcoB08EcnZhEzCHvnda7OxkPe6gIL7iqu3C7EVb4Nb12I0P9Bu7DQRms0U0NUlCjt08VPUU2F60Ock/z5Mz+jsHsMD+HjzlvFzy0XRwd1g56XplPp53BfenNJ2Hl4HAfDcqvrJ2le/3R6+5F28X7mcMhOpHdnXwc/sj+19PX7vTsxWn7rc6QcY7IOPU/H/Nqx/ZvUzRpjw=='),
+    'twilight': (510, 'eNqNU1l2wzAIBO5/wP62B4HYEsuAlaR5L9ZsIEUxvz9/RtfHeD1pEUeJbePUrHDzXNfwbWs6PbOG1fsU97pR/+RQl/0gN/TaA+t6TfWlPP/e86mZfdLe6N6HDh5BDU3dD9uz1YdARy16Js4f0vMtq2/0yOPFYQ/FnDW98S+aPS+9svXnQG5cpIKHWfULwNqLBzbVoel+y51b1mp6Ey9OnqfN94QEBo+8H3l987yGwDfUYuqUcDoXZqMxsRsz+rTWRR3eqLDr6xkYMo7OK2Dmhy/3yr1OPnDMS/Y85L5hJq8n1+OMBDmqvbg85pE7ef6Vpln3D3nip/bfzNav08o5l35gCY8z2zLSvcTCmcs6YeCnHGduY8ygxtDL9ZmRkV+aAJdWU1yKZ58bl773xpxA/6e+VgEcvROfvXOWDxnHxNDH3/iG+8uR08cwuVyTi1P8Am9K7qk='),
+    'twilight_shifted': (510, 'eNqNlVuWwyAMQ2W2MAvp5+x/Y3gS4odsaKfpabCuZJJAc/r6+VXBdVzn9VlqkaWfs6RPTDCovvmASHrBXEvy1RuaPBnZI+nBvIdd+lCv+cTyxXvG5Q/PEVu16cFa0h+VuZaNoeVQc4N9fMFylI1TPZLJ0T9zIS0DxznkkHfGOuohO6M52/LGPH3pvEfkWy77cjor2yR12UqG6vvX13oqJx9Sc0dNfaB+9lD7/X1iL95CybcRsV3pAcnAb7XCDqWRalVTT32PSvXySz1rrZ6fxObTQ2NlJ529Jw/zlLN6vuP7fd0s78muMVlr0WrXDs/GnId7KDNbPjJoc4ByaBnEXLkFe654cauKuo3qjxucM1q33B5/97fch+8xg84k6onP+dn7wVyDldzSmtngmrl/a+/Xp9+uNZ333EH3fPLOmt88lDo9+1vPjNfX+Acvd+eI'),
+    'vanimo': (256, 'eNqNj1sWwyAIRAGz/5V1SVVaEHDMo6fxY+4MD42+3jr6oDEGqWm/0+71LUMPs8Wb6ppHPbEOvWRbbqw3OWa6eiuHet+yvvl+ylwVfbD1Zl9k/7DP0dwzwCf7sfcnp6f4r0nOdsKVX8e+KxNTJUWcnrxO0VcemHllnJlgjV0ty14WzHjqA4v8ysDHXqkcmB9mbmq4a+2GOuMe83hf7jy/I1UufjJoy1zCS3lpbdWSXVtpO3lpR3Co+S834NlzlP8A30xfbQ=='),
+    'viridis': (256, 'eNqNU4kNwyAMPMNqHaH7j1Jq/AOhqgi6x2cTKeFF7wEigBo/imCk6TXmhqqz7j2RrfnI5h6brvUhGj80JC8+IT3LuZ/o+ZrFmmk4ewJp0xXp4tcznnv+zR8e7vXk417Hmb3NwOIVjb2+cioeBVoN7tmvtuDG5dON0M1qLXRmqicbmzav0efBU79ftfZ0ZK/zPmvYcPZaX2LO0KzOV19z6Vtf5Tajzu3wdxl2tnMw12vThZNxRuaCvNSfiz2+v1+oC4kI'),
+    'winter': (256, 'eNpjYPj/n4HxPwMDIwPDgNEMQJppAPkgGgSY8LiTZHkYm1bmU9l+UtUR1I9mP8n6R+2nh/0AHAaCfg=='),
+}
+
+#the exclusive or of the reversed colormaps with the reversed table of the colormap they reverse
+reversed_tables = {
+    'Accent_r': 'eNpjYMAPAAAgAAE=',
+    'Blues_r': 'eNpjYBgFo2CQAcbRIKAXAAAFawAC',
+    'BrBG_r': 'eNpjYBgFo2AUEA8Yh5VvAATOAAI=',
+    'BuGn_r': 'eNpjYBgkgJFh2IBh5JUhB5hHg4AkAAANswAG',
+    'BuPu_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'CMRmap_r': 'eNpjYCAFMDJQBijVPwqGCmAcjf0hAQAOoAAF',
+    'Dark2_r': 'eNpjYMAPAAAgAAE=',
+    'GnBu_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'Grays_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'Greens_r': 'eNpjYBgkgJFh2IBh5JVRMMwBAAojAAM=',
+    'Greys_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'OrRd_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'Oranges_r': 'eNpjYBgFo2AYAfbRICAFAAAMSQAI',
+    'PRGn_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'Paired_r': 'eNpjYCANAAAAMAAB',
+    'Pastel1_r': 'eNpjYCAMAAAkAAE=',
+    'Pastel2_r': 'eNpjYMAPAAAgAAE=',
+    'PiYG_r': 'eNpjYBgFo2AIAPbRIKAFAAANYQAI',
+    'PuBuGn_r': 'eNpjYBgFgxIwjgbBKKA9AAAGZwAC',
+    'PuBu_r': 'eNpjYBgFgxIwjgbBKKA9AAAGZwAC',
+    'PuOr_r': 'eNpjYBgFo2CEAOZRd6ADAAjaAAc=',
+    'PuRd_r': 'eNpjYBgFgxIwjgbBKKA9AAAGZwAC',
+    'Purples_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'RdBu_r': 'eNpjYBgFo2AIAEZGys1gpqkDh2SwAgAKnAAH',
+    'RdGy_r': 'eNpjYCANMDMzk0UPdcDIyMgwCgY0Aig3g6ZJcWimDwD9KgBJ',
+    'RdPu_r': 'eNpjYBgFDIxEio2CUTDMAAAJ4gAD',
+    'RdYlBu_r': 'eNpjYBgFo2CkAMbRIEADAAUSAAI=',
+    'RdYlGn_r': 'eNpjYBgFo2AoAMZBYsbwAgAGaAAD',
+    'Reds_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'Set1_r': 'eNpjYCAMAAAkAAE=',
+    'Set2_r': 'eNpjYMAPAAAgAAE=',
+    'Set3_r': 'eNpjYCANAAAAMAAB',
+    'Spectral_r': 'eNpjYBgFo2AoAMZBYsbwAgAGaAAD',
+    'Wistia_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'YlGnBu_r': 'eNpjYBgFdAH8o0EwCgYfAAAq2QAQ',
+    'YlGn_r': 'eNpjYBgF1AaMVDCDfTQYRwEdAAAXhAAJ',
+    'YlOrBr_r': 'eNpjYBgYwMwwCkbBKBhoAAAOmAAE',
+    'YlOrRd_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'afmhot_r': 'eNpjYEAHjAy4AT45auonRt2oftroxw+Yh6l+ZHF2PPLMBOTJ1c+Aph+fO9kJhAMp+gFyMAB5',
+    'autumn_r': 'eNpjYCABsDNQBijVPwoGHjAOU/3I4sx45BkJyJOrnwFNPz53MhMIBxL0AwBOwgA3',
+    'berlin_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'binary_r': 'eNpjYGBgYGRkZGBmZgbT2ABMHhegVD8IIOvHZg6yflzylOjHJ04sGOr6R8HAA3Z2drrqBwCtDQCj',
+    'bone_r': 'eNpjYBjkgJ2APCOF5jMOXa8xU6hfnkL3U2r/QPufn8bxyzjASZsYAACpAwBd',
+    'brg_r': 'eNpjYGBgYGZABTj5jATkydRPNGBkoAwwUqiWkQSzyNGPLs9IwHwkeXYC+tlx6se0iB2fRUA2fnkCDqU4YBhooH+gEhm2PMNIWR4jUT8A7KwAdQ==',
+    'bwr_r': 'eNpjYAACZmYGFEBv/iigHLCzUyZPG6NGAZFgoLIgADSnAJk=',
+    'cividis_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'cool_r': 'eNpjYAACRiBmhtLYAFSenQG/PNn6GdD0M+KQZyAgT4l+fOLEgqGufwR4kZioZ8Yjz0hAnlz9cMBOVFbCHQ4k6gcA3KIAbQ==',
+    'coolwarm_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'copper_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'cubehelix_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'flag_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'gist_earth_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'gist_gray_r': 'eNpjYCAesLOzM1ACKNU/CgYeMDIyDkv9yOLMzMw45UE0Pnly9SMDkDw+d+KTJ1U/AORGAKM=',
+    'gist_grey_r': 'eNpjYCAesLOzM1ACKNU/CgYeMDIyDkv9yOLMzMw45UE0Pnly9SMDkDw+d+KTJ1U/AORGAKM=',
+    'gist_heat_r': 'eNpjYEADjIwMOAE+OWrqJ0YdzfRD8QDqZxxI+4cwYKaSfkYigpgU/bTmM1AgDwBhJAAu',
+    'gist_ncar_r': 'eNpjYBhOgJFhFIyCUUA8AAAHMgAC',
+    'gist_rainbow_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'gist_stern_r': 'eNrFUkEKACAMmnjo/z+udqlDZTUiYQxmDieZNSQbg6VQ+dmDTUT1cr/w/xvpiof7j+Lkfq6cYu5U/p/aEctvR8+bICAWoOt8oO+HHhjHPAR/qM9R7wC1',
+    'gist_yarg_r': 'eNpjYEAF7OzsDLgAIyMjAyFADf3EqBvVTxv9o2BgAb78Qwv9AFtkAOs=',
+    'gist_yerg_r': 'eNpjYEAF7OzsDLgAIyMjAyFADf3EqBvVTxv9o2BgAb78Qwv9AFtkAOs=',
+    'gnuplot2_r': 'eNpjYEAHjAyjYBSMPMCOxObHI89OQJ5c/Qxo+tnxuBOfPGn6AWi2AM4=',
+    'gnuplot_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'gray_r': 'eNpjYCAesLOzM1ACKNU/CgYeMDIyDkv9yOLMzMw45UE0Pnly9SMDkDw+d+KTJ1U/AORGAKM=',
+    'grey_r': 'eNpjYCAesLOzM1ACKNU/CgYeMDIyDkv9yOLMzMw45UE0Pnly9SMDkDw+d+KTJ1U/AORGAKM=',
+    'hot_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'hsv_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'inferno_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'jet_r': 'eNpjYBgFAw8YR4NgFAwIAAAGegAC',
+    'magma_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'managua_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'nipy_spectral_r': 'eNpjYCABsLMzDArAyDAKRsEooAIAADzOABA=',
+    'ocean_r': 'eNrNkrENwCAMBP/lgtIjMAr7b4XSGQOC6IvkWut0tmRghMQWQ4HCjf/0q9AgNNS+DD/qlsv+7kH+7vvJZ/BtnlcG3977fvIx+pb2bPFBbD40+3nua78D24MBVw==',
+    'okabe_ito_r': 'eNpjYMAPAAAgAAE=',
+    'pink_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'plasma_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'prism_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'rainbow_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'seismic_r': 'eNpjYBjhgJEROx+dxiWPyxxC9qDLIctjMxufPKX2U8EodOfhCx5s8pTYT2xUkRplIwEAAIRAAEE=',
+    'spring_r': 'eNpjYAABRiBmhtLYAFSenQG/PNn6GdD0M+KQZyAgT4l+fOLEgqGufwR4kZioZ8Yjz0hAnlz9cMBOVFbCHQ6k6QcA3DYAbQ==',
+    'summer_r': 'eNpjYCAesBOjiBG3YnYGOgBGelqGx36G4Wk/4zDVjyzOjEeekYA8ufoZ0PTjcyczgXAAy7MTpx8Ai2cAUA==',
+    'tab10_r': 'eNpjYCAOAAAAKAAB',
+    'tab20_r': 'eNpjYKAuAAAAUAAB',
+    'tab20b_r': 'eNpjYKAuAAAAUAAB',
+    'tab20c_r': 'eNpjYKAuAAAAUAAB',
+    'terrain_r': 'eNpjYMAEjAzYASMBedz62UnST7y59NU/mC1np1CeFKcyEhBjxKKGkDyqWkaS7GckUpxxqKUHRto7FgB0WAAz',
+    'turbo_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'twilight_r': 'eNpjYBgFo2AUjIJRMApGwUgBAAf4AAE=',
+    'twilight_shifted_r': 'eNpjYBgFo2AUjIJRMApGwUgBAAf4AAE=',
+    'vanimo_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'viridis_r': 'eNpjYBgFo2AUjFQAAAQAAAE=',
+    'winter_r': 'eNpjYCAGsKNQZANK9Y+CAQaMYESpEYPSfmRxZiwJlxHJfmZS9SPJ49LPgKafEVvGQbKfkRT9aO5AkgcAdmwAUA==',
+}
@@ -0,0 +1,138 @@
+"""The batch module of choropleth_geojson. It renders a list of maps across a pool of worker processes and writes each
+figure to its output file. The geometry of every geojson file is compiled once into the on-disk cache of the loader
+module before the jobs are dispatched, and the workers memory-map it from there, so the geometry is neither parsed nor
+pickled per job and the pages of the cache are shared by all the workers through the operating system.
+"""
+
+import os
+import time
+import traceback
+from .cache import style_key
+from .loader import cache_key, load_geometry
+from .serialize import write_html, write_json
+
+#the choropleth instances of a worker process, one per version of a geojson file and subregion label, reused by the jobs on
+#that file. With workers <= 1 they live in the calling process only for the duration of render_batch.
+_instances = {}
+
+def render_batch(apikey, jobs, workers=None, cache_dir=None, include_plotlyjs='cdn'):
+    """Render a list of jobs and write their figures, in parallel across worker processes. Return one result dictionary
+    per job, in the order of the jobs, with the entries output (the output path of the job), error (None, or the
+    traceback of the exception raised by the job) and seconds (the time the job took in its worker). A failing job does
+    not stop the other jobs.
+
+    Parameters
+    ----------
+    apikey : str
+        The Mapbox API key of the figures (see choropleth), a job can override it with an apikey entry.
+
+    jobs : list of dict
+        The jobs, each a dictionary with the following entries,
+
+        * df: the pandas_dataframe of the map.
+        * geojson: the path of the geojson file (see choropleth.from_file). Jobs on the same file share its geometry,
+          and the processed geometry (simplified outlines, centers) is reused by the jobs that run in the same worker.
+        * glabel: the label of the subregions in the geojson file.
+        * output: the path of the output file, an .html file or a .json file with the figure dictionary (see the
+          serialize module). A list of paths when the options give a list as col_str, one per figure.
+        * options: (optional) the keyword arguments of choroplot().
+        * normalize: (optional) the normalizer of the join (see choropleth).
+
+    workers : int
+        (Default: None, the number of CPUs)
+        The number of worker processes. With 0 or 1 the jobs are rendered one after the other in the calling process.
+
+    cache_dir : str
+        (Default: None, see loader.default_cache_dir())
+        The cache directory of the compiled geometry.
+
+    include_plotlyjs : bool or str
+        (Default: 'cdn', the html files load plotly.js from a CDN)
+        How the html files include plotly.js (see serialize.write_html). True embeds the whole library in every file.
+
+    """
+    results = [None]*len(jobs)
+
+    #compile every geojson file once, the workers only memory-map the cache
+    failed = {}
+    for path in {job.get('geojson') for job in jobs}:
+        try:
+            load_geometry(path, cache=True, cache_dir=cache_dir)
+        except Exception:
+            failed[path] = traceback.format_exc()
+
+    pending = []
+    for k, job in enumerate(jobs):
+        if job.get('geojson') in failed:
+            results[k] = dict(output=job.get('output'), error=failed[job.get('geojson')], seconds=0.0)
+        else:
+            pending.append(k)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        try:
+            for k in pending:
+                results[k] = _render(apikey, jobs[k], cache_dir, include_plotlyjs)
+        finally:
+            _instances.clear()
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [(k, executor.submit(_render, apikey, jobs[k], cache_dir, include_plotlyjs)) for k in pending]
+            for k, future in futures:
+                try:
+                    results[k] = future.result()
+                except Exception:
+                    #the worker itself failed, e.g. the job could not be pickled
+                    results[k] = dict(output=jobs[k].get('output'), error=traceback.format_exc(), seconds=0.0)
+
+    return results
+
+def _render(apikey, job, cache_dir, include_plotlyjs):
+    """Render one job and write its figures (in a worker process), capturing any exception in the result."""
+    start = time.perf_counter()
+    try:
+        plot = _instance(job.get('apikey', apikey), job['df'], job['geojson'], job['glabel'], job.get('normalize'), cache_dir)
+        figs = plot.choroplot(**job.get('options', {}))
+        outputs = job['output']
+        if not isinstance(figs, list):
+            figs, outputs = [figs], [outputs]
+        if len(figs) != len(outputs):
+            raise ValueError('the job has {} figures but {} output paths'.format(len(figs), len(outputs)))
+
+        for fig, output in zip(figs, outputs):
+            write_figure(fig, output, include_plotlyjs)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return dict(output=job.get('output'), error=error, seconds=time.perf_counter() - start)
+
+def _instance(apikey, df, path, glabel, normalize, cache_dir):
+    """Return the choropleth instance of the worker for the geojson file at path, with the data of the job."""
+    from . import choropleth
+
+    #the key of the file changes with its size and modification time, an edited file gets a new instance
+    key = (cache_key(path), glabel, cache_dir)
+    plot = _instances.get(key)
+    if plot is None:
+        plot = choropleth.from_file(path, apikey, df, glabel, normalize=normalize, cache=True, cache_dir=cache_dir)
+        _instances[key] = plot
+
+    #the normalizer of a job is a new object after unpickling, the join of the subregions is rebuilt with it
+    if style_key(normalize) != style_key(plot.normalize_):
+        plot.normalize_ = normalize
+        plot.cache_['geometry'].discard(('join',))
+
+    #the other caches of the instance are keyed by the data, so the instance can serve the data of any job
+    plot.apikey_ = apikey
+    plot.df_ = df
+    return plot
+
+def write_figure(fig, path, include_plotlyjs='cdn'):
+    """Write the figure dictionary fig to path, an .html file or a .json file."""
+    if path.lower().endswith('.json'):
+        write_json(fig, path)
+    else:
+        write_html(fig, path, include_plotlyjs)
@@ -0,0 +1,73 @@
+"""The cache module of choropleth_geojson. The choropleth class keeps the artifacts of its figures (the processed geometry,
+the colors and hover texts of the data, and the assembled traces and layers) in bounded least-recently-used caches,
+so that a figure that differs from an earlier one only in its title or in one data column is mostly built from cache.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+class lru_cache():
+    """A least-recently-used cache with a bounded number of entries and hit and miss counters."""
+
+    def __init__(self, maxsize=32):
+        """
+        Parameters
+        ----------
+        maxsize : int
+            (Default: 32)
+            The maximum number of entries, the least recently used entry is evicted beyond it. None means unbounded.
+
+        """
+        self.maxsize_ = maxsize
+        self.entries_ = OrderedDict()
+        self.hits_ = 0
+        self.misses_ = 0
+
+    def get(self, key, build):
+        """Return the entry for key, calling build() to create it on a miss."""
+        if key in self.entries_:
+            self.hits_ += 1
+            self.entries_.move_to_end(key)
+            return self.entries_[key]
+
+        self.misses_ += 1
+        value = build()
+        self.entries_[key] = value
+        if self.maxsize_ is not None:
+            while len(self.entries_) > self.maxsize_:
+                self.entries_.popitem(last=False)
+        return value
+
+    def __contains__(self, key):
+        return key in self.entries_
+
+    def discard(self, key):
+        """Remove the entry for key, if there is one."""
+        self.entries_.pop(key, None)
+
+    def clear(self):
+        """Remove all the entries (the counters are kept)."""
+        self.entries_.clear()
+
+    def info(self):
+        """Return a dictionary with the hits, misses, current size and maximum size of the cache."""
+        return dict(hits=self.hits_, misses=self.misses_, size=len(self.entries_), maxsize=self.maxsize_)
+
+def series_key(series):
+    """Return a key that identifies a pandas series by its name, index and values, so that the artifacts computed from
+    the series are found again as long as the data is the same, and recomputed when the data changes. A dataframe is
+    identified by its column names, index and values in the same way.
+
+    """
+    from pandas.util import hash_pandas_object
+    digest = hashlib.sha1(hash_pandas_object(series, index=True).values.tobytes()).hexdigest()
+    name = tuple(series.columns) if hasattr(series, 'columns') else series.name
+    return (name, digest)
+
+def style_key(value):
+    """Return a hashable key for a style option, which may be an unhashable value such as a dictionary or a list."""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
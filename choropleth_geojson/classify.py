@@ -0,0 +1,133 @@
+"""The classify module of choropleth_geojson. It computes the class edges of the binned color schemes of choroplot()
+(quantile, equal interval, natural breaks and user-supplied edges) and assigns the values to the classes. The natural
+breaks of Jenks are the optimal 1D k-means classes, found by a dynamic program over the sorted distinct values with the
+divide and conquer optimization, evaluated level by level for all the intervals of a level at once.
+"""
+
+import numpy as np
+from .geometry import _first_argmax, _offsets
+
+schemes = ('quantile', 'equal_interval', 'jenks', 'edges')
+
+def class_edges(values, scheme, bins=5, edges=None):
+    """Return the sorted edges of the classes of values, an array of the lower bound of each class followed by the upper
+    bound of the last class. The missing values are ignored. There may be fewer than bins classes when the values have
+    fewer distinct values (or quantiles) than that, and the last two edges are equal when the last class has a single
+    distinct value.
+
+    Parameters
+    ----------
+    values : array_like
+        The values to classify.
+
+    scheme : str
+        One of the following,
+
+        * 'quantile': classes with the same number of values.
+        * 'equal_interval': classes of the same width between the smallest and the largest value.
+        * 'jenks': the natural breaks of Jenks, the classes with the smallest sum of the squared deviations of the
+          values from the mean of their class.
+        * 'edges': the edges given by edges.
+
+    bins : int
+        (Default: 5)
+        The number of classes.
+
+    edges : array_like
+        (Default: None)
+        The edges of scheme='edges', at least two increasing values.
+
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+
+    if scheme == 'edges':
+        if edges is None or len(edges) < 2 or np.any(np.diff(edges) <= 0):
+            raise ValueError("scheme='edges' requires at least two increasing edges")
+        return np.asarray(edges, dtype=float)
+    if scheme not in schemes:
+        raise ValueError('scheme must be one of {}, got {!r}'.format(', '.join(repr(name) for name in schemes), scheme))
+    if bins < 1:
+        raise ValueError('bins must be at least 1, got {}'.format(bins))
+    if not len(values):
+        return np.zeros(2)
+
+    if scheme == 'quantile':
+        edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)))
+        return edges if len(edges) > 1 else np.r_[edges, edges]
+    if scheme == 'equal_interval':
+        return np.linspace(values.min(), values.max(), bins + 1)
+    return jenks_edges(values, bins)
+
+def class_indices(values, edges):
+    """Return the class of each of values, the index of the class of edges (see class_edges) it falls in, or -1 for the
+    missing values. The values below the first edge or above the last one are put in the first or the last class.
+
+    """
+    values = np.asarray(values, dtype=float)
+    classes = np.clip(np.searchsorted(edges[1:-1], values, side='right'), 0, max(len(edges) - 2, 0))
+    classes[np.isnan(values)] = -1
+    return classes
+
+def jenks_edges(values, bins):
+    """Return the edges of the natural breaks of Jenks of values into bins classes (see class_edges).
+
+    The classes are found by the dynamic program of the optimal 1D k-means over the n sorted distinct values, weighted
+    by their counts: D[m, j] is the smallest cost of m classes over the first j values, the cost of a class being the
+    weighted sum of the squared deviations of its values, which the prefix sums of the weights, the values and their
+    squares give in constant time. The optimal start of the last class is nondecreasing in j, so each level m is solved
+    by divide and conquer in O(n log n), every interval of a recursion depth being evaluated at once with numpy.
+
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    distinct, counts = np.unique(values, return_counts=True)
+    n = len(distinct)
+    if n <= bins:
+        return np.r_[distinct, distinct[-1:]]
+
+    #centered for the accuracy of the sums of squares
+    centered = distinct - np.average(distinct, weights=counts)
+    weights = _offsets(counts).astype(float)
+    sums = np.r_[0, np.cumsum(counts*centered)]
+    squares = np.r_[0, np.cumsum(counts*centered**2)]
+
+    def cost(i, j):
+        #the cost of the class of the distinct values i to j - 1
+        return squares[j] - squares[i] - (sums[j] - sums[i])**2/(weights[j] - weights[i])
+
+    previous = np.full(n + 1, np.inf)
+    previous[1:] = cost(np.zeros(n, dtype=np.int64), np.arange(1, n + 1))
+    starts = np.zeros((bins + 1, n + 1), dtype=np.int64)
+
+    for m in range(2, bins + 1):
+        current = np.full(n + 1, np.inf)
+        #the intervals [jlo, jhi] of the ends j still to solve and the bounds [olo, ohi] of their optimal starts
+        jlo, jhi = np.array([m]), np.array([n])
+        olo, ohi = np.array([m - 1]), np.array([n - 1])
+        while len(jlo):
+            mid = (jlo + jhi)//2
+            lengths = np.minimum(ohi, mid - 1) - olo + 1
+            offsets = _offsets(lengths)
+            groups = np.repeat(np.arange(len(mid)), lengths)
+            i = olo[groups] + np.arange(offsets[-1]) - offsets[groups]
+            j = mid[groups]
+            total = previous[i] + cost(i, j)
+
+            _, first = _first_argmax(-total, groups)
+            best = i[first]
+            current[mid] = total[first]
+            starts[m, mid] = best
+
+            left = jlo <= mid - 1
+            right = mid + 1 <= jhi
+            jlo, jhi = np.r_[jlo[left], mid[right] + 1], np.r_[mid[left] - 1, jhi[right]]
+            olo, ohi = np.r_[olo[left], best[right]], np.r_[best[left], ohi[right]]
+        previous = current
+
+    #walk back the starts of the classes from the end of the values
+    first = [n]
+    for m in range(bins, 1, -1):
+        first.append(starts[m, first[-1]])
+    first = np.array([0] + first[:0:-1])
+    return np.r_[distinct[first], distinct[-1]]
@@ -0,0 +1,133 @@
+"""The colors module of choropleth_geojson. It maps the data to the colors of a colormap with numpy alone, from the lookup
+tables of the matplotlib colormaps bundled in _colormaps (see scripts/make_colormaps.py), with the same normalization and
+the same color bytes as matplotlib. matplotlib is only imported for the colormaps that have no bundled table (e.g. the
+colormaps registered by the user or colormap objects) and for the color specifications other than gray levels and hex
+strings.
+"""
+
+import base64
+import re
+import zlib
+import numpy as np
+
+_hex_pattern = re.compile(r'#[0-9a-fA-F]{6}([0-9a-fA-F]{2})?$')
+_colormaps = {}
+
+class lut_colormap():
+    """A colormap given by its lookup table, mapped like a matplotlib colormap of as many colors with the default under,
+    over and bad colors: the first color below 0, the last color above 1 and transparent black for NaN.
+
+    """
+
+    def __init__(self, name, lut):
+        """
+        Parameters
+        ----------
+        name : str
+            The name of the colormap.
+
+        lut : numpy array of uint8 of shape (N, 4)
+            The RGBA bytes of the N colors of the colormap.
+
+        """
+        self.name = name
+        self.lut_ = lut
+        self.N = len(lut)
+
+    def __call__(self, X, alpha=None, bytes=False):
+        """Return the RGBA colors of the values X, from 0 to 1, as an array of shape X.shape + (4,) of bytes, or of floats
+        from 0 to 1 without bytes (see matplotlib.colors.Colormap).
+
+        """
+        xa = np.array(X, dtype=float)*self.N
+        xa[xa == self.N] = self.N - 1
+        bad = np.isnan(xa)
+        with np.errstate(invalid='ignore'):
+            index = np.clip(np.where(bad, 0, xa), 0, self.N - 1).astype(np.int64)
+
+        rgba = self.lut_[index]
+        if alpha is not None:
+            rgba[..., 3] = np.clip(alpha, 0, 1)*255
+        rgba[bad] = 0
+        return rgba if bytes else rgba/255
+
+    def reversed(self):
+        """Return the colormap with the colors in reverse order."""
+        return lut_colormap(self.name + '_r', self.lut_[::-1])
+
+def get_colormap(cmap):
+    """Return the colormap named cmap, a lut_colormap of the bundled table of the matplotlib colormap of that name, or the
+    matplotlib colormap itself when there is no table for it. cmap is returned as it is when it is already a colormap.
+    The bundled colormaps are decoded once and reused.
+
+    """
+    if not isinstance(cmap, str):
+        return cmap
+    if cmap not in _colormaps:
+        lut = lookup_table(cmap)
+        if lut is None:
+            return _matplotlib_colormap(cmap)
+        _colormaps[cmap] = lut_colormap(cmap, lut)
+    return _colormaps[cmap]
+
+def lookup_table(name):
+    """Return the bundled lookup table of the colormap name, an array of RGBA bytes of shape (N, 4), or None."""
+    from . import _colormaps as bundled
+    if name in bundled.tables:
+        n, data = bundled.tables[name]
+        return np.cumsum(_decode(data).reshape(n, 4), axis=0, dtype=np.uint8)
+    if name in bundled.reversed_tables:
+        reverse = lookup_table(name[:-2])[::-1]
+        return reverse ^ _decode(bundled.reversed_tables[name]).reshape(reverse.shape)
+    return None
+
+def _decode(data):
+    return np.frombuffer(zlib.decompress(base64.b64decode(data)), dtype=np.uint8)
+
+def _matplotlib_colormap(cmap):
+    """Return the matplotlib colormap registered under the name cmap."""
+    try:
+        from matplotlib import colormaps
+    except ImportError:
+        from matplotlib import cm
+        return cm.get_cmap(cmap)
+    return colormaps[cmap]
+
+def normalize(values, vmin, vmax, log=False):
+    """Return values scaled from vmin and vmax to 0 and 1, linearly or logarithmically (log=True), as matplotlib's
+    Normalize and LogNorm do. The values are 0 when vmin equals vmax, and NaN where they are missing (or not positive on the
+    logarithmic scale), which the colormaps map to the bad color.
+
+    """
+    values = np.array(values, dtype=float)
+    if vmin == vmax:
+        return np.zeros_like(values)
+    if not log:
+        return (values - vmin)/(vmax - vmin)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_vmin, t_vmax = np.log10([vmin, vmax])
+        scaled = (np.log10(values) - t_vmin)/(t_vmax - t_vmin)
+    scaled[~np.isfinite(scaled)] = np.nan
+    return scaled
+
+def to_rgba(color):
+    """Return the RGBA tuple of floats of the color specification color, as matplotlib.colors.to_rgba. Gray levels
+    ('0.5') and hex strings ('#rrggbb' or '#rrggbbaa') are converted directly, the other specifications (names, tuples,
+    ...) by matplotlib.
+
+    """
+    if isinstance(color, str):
+        if _hex_pattern.match(color):
+            channels = tuple(int(color[k:k + 2], 16)/255 for k in range(1, len(color), 2))
+            return channels if len(channels) == 4 else channels + (1.,)
+        try:
+            gray = float(color)
+        except ValueError:
+            pass
+        else:
+            if 0 <= gray <= 1:
+                return gray, gray, gray, 1.
+
+    from matplotlib.colors import to_rgba as matplotlib_to_rgba
+    return matplotlib_to_rgba(color)
@@ -0,0 +1,440 @@
+"""The geometry module of choropleth_geojson. It compiles the Polygon and MultiPolygon features of a geojson dictionary
+into a geometry index: one flat buffer with the coordinates of every vertex, plus offset arrays that delimit the rings,
+the polygons and the features in that buffer. Quantities over all the features, such as the centers used for the hover
+texts, are then computed with a handful of NumPy operations instead of a Python loop over nested coordinate lists.
+"""
+
+import os
+import numpy as np
+
+#the arrays of a geometry index, as saved by geometry_index.save()
+_array_names = ('coords', 'ring_offsets', 'polygon_offsets', 'feature_offsets', 'types')
+
+#geometry type codes stored in geometry_index.types_
+OTHER, POLYGON, MULTIPOLYGON = 0, 1, 2
+geometry_type_codes = {'Polygon': POLYGON, 'MultiPolygon': MULTIPOLYGON}
+
+class geometry_index():
+    """The compiled geometry of a geojson dictionary. The vertices of ring r are coords_[ring_offsets_[r]:ring_offsets_[r+1]],
+    the rings of polygon p are ring_offsets_[polygon_offsets_[p]:polygon_offsets_[p+1]] (the first ring being the exterior
+    ring and the others the holes), and the polygons of feature k are polygon_offsets_[feature_offsets_[k]:feature_offsets_[k+1]].
+
+    """
+
+    def __init__(self, coords, ring_offsets, polygon_offsets, feature_offsets, types):
+        """
+        Parameters
+        ----------
+        coords : numpy array of shape (number of vertices, 2)
+            The longitude and latitude of every vertex.
+
+        ring_offsets, polygon_offsets, feature_offsets : numpy arrays of int
+            The offsets of the rings in coords, of the polygons in ring_offsets and of the features in polygon_offsets.
+            Each array has one more entry than the number of rings, polygons and features respectively.
+
+        types : numpy array of uint8
+            The geometry type code (OTHER, POLYGON or MULTIPOLYGON) of each feature.
+
+        """
+        self.coords_ = coords
+        self.ring_offsets_ = ring_offsets
+        self.polygon_offsets_ = polygon_offsets
+        self.feature_offsets_ = feature_offsets
+        self.types_ = types
+
+        self.n_ = len(types)
+        self.centers_ = {}
+        self.bounds_ = None
+
+    @classmethod
+    def from_geojson(cls, geojson):
+        """Compile the features of a geojson dictionary into a geometry index."""
+        return cls.from_geometries([feature['geometry'] for feature in geojson['features']])
+
+    @classmethod
+    def from_geometries(cls, geometries):
+        """Compile a list (or any iterable) of geojson geometry dictionaries into a geometry index. Geometries other than
+        Polygon and MultiPolygon (or None) are kept as features without any polygon.
+
+        """
+        builder = geometry_builder()
+        for geometry in geometries:
+            builder.add(geometry)
+        return builder.build()
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        """Load a geometry index saved with save(). By default the arrays are memory-mapped, so loading takes
+        no time and the coordinates are read from disk as they are used.
+
+        """
+        arrays = [np.load(os.path.join(directory, name + '.npy'), mmap_mode=mmap_mode) for name in _array_names]
+        return cls(*arrays)
+
+    def save(self, directory):
+        """Save the arrays of the geometry index as .npy files in directory, see load()."""
+        os.makedirs(directory, exist_ok=True)
+        for name in _array_names:
+            np.save(os.path.join(directory, name + '.npy'), np.ascontiguousarray(getattr(self, name + '_')))
+
+    def geometries(self):
+        """Return the list of geojson geometry dictionaries of all features."""
+        coords = self.coords_.tolist()
+        rings = [coords[i:j] for i, j in zip(self.ring_offsets_[:-1].tolist(), self.ring_offsets_[1:].tolist())]
+        polygons = [rings[i:j] for i, j in zip(self.polygon_offsets_[:-1].tolist(), self.polygon_offsets_[1:].tolist())]
+
+        geometries = []
+        for k, (i, j) in enumerate(zip(self.feature_offsets_[:-1].tolist(), self.feature_offsets_[1:].tolist())):
+            if self.types_[k] == POLYGON:
+                geometries.append(dict(type='Polygon', coordinates=polygons[i]))
+            elif self.types_[k] == MULTIPOLYGON:
+                geometries.append(dict(type='MultiPolygon', coordinates=polygons[i:j]))
+            else:
+                geometries.append(None)
+        return geometries
+
+    def ring_lengths(self):
+        """Return the number of vertices of each ring."""
+        return np.diff(self.ring_offsets_)
+
+    def ring_owners(self):
+        """Return the polygon and the feature that each ring belongs to."""
+        ring_polygon = np.repeat(np.arange(len(self.polygon_offsets_) - 1), np.diff(self.polygon_offsets_))
+        polygon_feature = np.repeat(np.arange(self.n_), np.diff(self.feature_offsets_))
+        return ring_polygon, polygon_feature[ring_polygon]
+
+    def ring_moments(self):
+        """Return the signed area and the area centroid (lon, lat) of each ring, computed with the shoelace formula on
+        coordinates taken relative to the first vertex of the ring for numerical accuracy.
+
+        """
+        starts, lengths = self.ring_offsets_[:-1], self.ring_lengths()
+        nonempty = lengths > 0
+        if not nonempty.any():
+            return np.zeros(len(lengths)), np.full((len(lengths), 2), np.nan)
+
+        #the next vertex of each vertex, wrapping around at the end of its ring
+        ring_of_vertex = np.repeat(np.arange(len(lengths)), lengths)
+        following = np.arange(len(self.coords_)) + 1
+        following[starts[nonempty] + lengths[nonempty] - 1] = starts[nonempty]
+
+        local = self.coords_ - self.coords_[starts[ring_of_vertex]]
+        x, y = local[:, 0], local[:, 1]
+        xn, yn = x[following], y[following]
+        cross = x*yn - xn*y
+
+        area2 = self.ring_sums(cross)
+        sums = self.ring_sums(np.column_stack(((x + xn)*cross, (y + yn)*cross)))
+
+        area = area2/2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            centroid = sums/(3*area2[:, None]) + self.coords_[np.minimum(starts, len(self.coords_) - 1)]
+        return area, centroid
+
+    def centers(self, method='mean'):
+        """Return the latitudes and the longitudes of the centers of all features. Features without any polygon get NaN.
+
+        Parameters
+        ----------
+        method : str
+            (Default: 'mean')
+            * 'mean': the mean of the vertices of the exterior ring of the polygon with the most vertices.
+            * 'area': the area-weighted centroid of the feature, the holes being subtracted. Features whose area is
+              zero fall back to 'mean'.
+
+        The centers are computed once per method and reused by the following calls.
+
+        """
+        if method not in self.centers_:
+            self.centers_[method] = self._centers(method)
+        lat_cen, lon_cen = self.centers_[method]
+        return lat_cen.copy(), lon_cen.copy()
+
+    def bounds(self):
+        """Return the bounding boxes of all features, an array of shape (number of features, 4) with the west, south, east
+        and north edges in degrees. Features without any polygon get NaN. The bounds are computed once and reused by the
+        following calls.
+
+        """
+        if self.bounds_ is None:
+            bounds = np.full((self.n_, 4), np.nan)
+            #the vertices of a feature are contiguous, from the first vertex of its first ring
+            vertex_offsets = self.ring_offsets_[self.polygon_offsets_[self.feature_offsets_]]
+            nonempty = np.diff(vertex_offsets) > 0
+            if nonempty.any():
+                starts = vertex_offsets[:-1][nonempty]
+                bounds[nonempty, :2] = np.minimum.reduceat(self.coords_, starts, axis=0)
+                bounds[nonempty, 2:] = np.maximum.reduceat(self.coords_, starts, axis=0)
+            self.bounds_ = bounds
+        return self.bounds_.copy()
+
+    def _centers(self, method):
+        """The centers, see centers()."""
+        lat_cen, lon_cen = self._vertex_mean_centers()
+
+        if method == 'area':
+            area, centroid = self.ring_moments()
+            ring_polygon, ring_feature = self.ring_owners()
+            exterior = np.zeros(len(area), dtype=bool)
+            exterior[self.polygon_offsets_[:-1][np.diff(self.polygon_offsets_) > 0]] = True
+
+            weight = np.where(exterior, 1, -1)*np.abs(area)
+            valid = weight != 0
+            total = np.bincount(ring_feature[valid], weight[valid], minlength=self.n_)
+            lon_sum = np.bincount(ring_feature[valid], (weight*centroid[:, 0])[valid], minlength=self.n_)
+            lat_sum = np.bincount(ring_feature[valid], (weight*centroid[:, 1])[valid], minlength=self.n_)
+
+            has_area = total > 0
+            lon_cen[has_area] = lon_sum[has_area]/total[has_area]
+            lat_cen[has_area] = lat_sum[has_area]/total[has_area]
+
+        elif method != 'mean':
+            raise ValueError("method must be one of 'mean' or 'area', got {!r}".format(method))
+
+        return lat_cen, lon_cen
+
+    def _vertex_mean_centers(self):
+        """The 'mean' centers, see centers()."""
+        lat_cen, lon_cen = np.full(self.n_, np.nan), np.full(self.n_, np.nan)
+        polygon_counts = np.diff(self.feature_offsets_)
+        if not polygon_counts.any():
+            return lat_cen, lon_cen
+
+        #the exterior ring of every polygon and its number of vertices
+        exterior = self.polygon_offsets_[:-1]
+        exterior_lengths = self.ring_lengths()[exterior]
+        polygon_feature = np.repeat(np.arange(self.n_), polygon_counts)
+
+        #the first polygon with the most vertices in each feature
+        features, largest = _first_argmax(exterior_lengths, polygon_feature)
+        largest = exterior[largest]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = self.ring_sums(self.coords_)[largest]/self.ring_lengths()[largest, None]
+        lon_cen[features], lat_cen[features] = means[:, 0], means[:, 1]
+        return lat_cen, lon_cen
+
+    def ring_sums(self, values):
+        """Return the sums of values (one row per vertex) over the vertices of each ring."""
+        lengths = self.ring_lengths()
+        nonempty = lengths > 0
+        sums = np.zeros((len(lengths),) + values.shape[1:])
+        if nonempty.any():
+            sums[nonempty] = np.add.reduceat(values, self.ring_offsets_[:-1][nonempty], axis=0)
+        return sums
+
+    def vertex_rings(self):
+        """Return the ring that each vertex belongs to."""
+        return np.repeat(np.arange(len(self.ring_offsets_) - 1), self.ring_lengths())
+
+    def downsample(self, step):
+        """Return a new geometry index that keeps every step-th vertex of each ring, plus the last vertex so that the
+        rings stay closed. Rings left with fewer than 4 vertices are dropped as in simplify().
+
+        """
+        position = np.arange(len(self.coords_)) - self.ring_offsets_[:-1][self.vertex_rings()]
+        keep = position % step == 0
+        keep[self.ring_offsets_[1:][self.ring_lengths() > 0] - 1] = True
+        return self._reduce(keep)
+
+    def simplify(self, tolerance):
+        """Return a new geometry index with the rings simplified by the Douglas-Peucker algorithm: the vertices that are
+        closer than tolerance (in degrees) to the simplified outline are removed. The first and the last vertex of each
+        ring are kept, so the rings stay closed. Holes and polygons whose simplified exterior ring has fewer than 4 vertices
+        are dropped, except that a feature always keeps its largest polygon. The index itself is not modified.
+
+        """
+        return self._reduce(self._douglas_peucker(tolerance))
+
+    def quantize(self, precision):
+        """Return a new geometry index with the coordinates rounded to precision decimal places, and the consecutive
+        vertices that became identical merged into one. Rings stay closed, and rings that collapse to fewer than 4 vertices
+        are dropped as in simplify(). At 5 decimal places (about 1 meter) the coordinates take a third of the characters
+        of full float64 precision in the plotted figure.
+
+        """
+        quantized = geometry_index(np.round(self.coords_, precision), self.ring_offsets_, self.polygon_offsets_,
+                                   self.feature_offsets_, self.types_)
+        coords = quantized.coords_
+
+        #a vertex is kept unless it is identical to the next vertex of its ring, the last vertex of each ring is kept
+        keep = np.ones(len(coords), dtype=bool)
+        if len(coords):
+            keep[:-1] = np.any(coords[:-1] != coords[1:], axis=1)
+            keep[self.ring_offsets_[1:][self.ring_lengths() > 0] - 1] = True
+        return quantized._reduce(keep)
+
+    def _douglas_peucker(self, tolerance):
+        """Return the mask of the vertices kept by the Douglas-Peucker simplification. The recursion is processed level by
+        level for all the segments of all the rings at once.
+
+        """
+        coords = self.coords_
+        x, y = np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1])
+        starts, lengths = self.ring_offsets_[:-1], self.ring_lengths()
+        keep = np.zeros(len(coords), dtype=bool)
+        nonempty = lengths > 0
+        keep[starts[nonempty]] = True
+        keep[starts[nonempty] + lengths[nonempty] - 1] = True
+
+        #a closed ring starts and ends on the same vertex, so it is first split at the vertex farthest from its start
+        if not (lengths > 2).any():
+            return keep
+        vertex_ring = self.vertex_rings()
+        inner = np.ones(len(coords), dtype=bool)
+        inner[starts[nonempty]] = False
+        distance = (x - x[starts[vertex_ring]])**2 + (y - y[starts[vertex_ring]])**2
+        _, farthest = _first_argmax(distance[inner], vertex_ring[inner])
+        farthest = np.flatnonzero(inner)[farthest]
+        keep[farthest] = True
+
+        ring_of_farthest = vertex_ring[farthest]
+        first = np.concatenate([starts[ring_of_farthest], farthest])
+        last = np.concatenate([farthest, starts[ring_of_farthest] + lengths[ring_of_farthest] - 1])
+        tolerance2 = tolerance**2
+
+        while len(first):
+            counts = last - first - 1
+            active = counts > 0
+            first, last, counts = first[active], last[active], counts[active]
+            if not len(first):
+                break
+
+            segment = np.repeat(np.arange(len(first)), counts)
+            vertex = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + first[segment] + 1
+
+            #the distance of each inner vertex to the segment between the first and the last vertex
+            ax, ay = x[first][segment], y[first][segment]
+            dx, dy = (x[last] - x[first])[segment], (y[last] - y[first])[segment]
+            px, py = x[vertex] - ax, y[vertex] - ay
+            length2 = dx*dx + dy*dy
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = np.clip(np.where(length2 > 0, (px*dx + py*dy)/length2, 0), 0, 1)
+            px -= t*dx
+            py -= t*dy
+            distance2 = px*px + py*py
+
+            _, farthest = _first_argmax(distance2, segment)
+            split = distance2[farthest] > tolerance2
+            farthest = vertex[farthest[split]]
+            keep[farthest] = True
+
+            first = np.concatenate([first[split], farthest])
+            last = np.concatenate([farthest, last[split]])
+
+        return keep
+
+    def _reduce(self, keep):
+        """Return a new geometry index with the vertices in the mask keep. Rings left with fewer than 4 vertices are
+        dropped, polygons without their exterior ring are dropped, and a feature that would lose all of its polygons
+        keeps the original exterior ring of its largest polygon.
+
+        """
+        vertex_ring = self.vertex_rings()
+        ring_polygon, ring_feature = self.ring_owners()
+        polygon_feature = np.repeat(np.arange(self.n_), np.diff(self.feature_offsets_))
+        exterior = self.polygon_offsets_[:-1]
+
+        keep = keep.copy()
+        ring_keep = np.bincount(vertex_ring[keep], minlength=len(ring_polygon)) >= 4
+        polygon_keep = ring_keep[exterior]
+
+        #features that would lose all of their polygons keep their largest exterior ring
+        lost = (np.bincount(polygon_feature[polygon_keep], minlength=self.n_) == 0) & (np.diff(self.feature_offsets_) > 0)
+        if lost.any():
+            area, _ = self.ring_moments()
+            lost_polygons = lost[polygon_feature]
+            _, largest = _first_argmax(np.abs(area[exterior])[lost_polygons], polygon_feature[lost_polygons])
+            restored = exterior[np.flatnonzero(lost_polygons)[largest]]
+            ring_keep[restored] = True
+            polygon_keep[ring_polygon[restored]] = True
+            keep[np.isin(vertex_ring, restored)] = True
+
+        ring_keep &= polygon_keep[ring_polygon]
+        keep &= ring_keep[vertex_ring]
+
+        ring_lengths = np.bincount(vertex_ring[keep], minlength=len(ring_polygon))[ring_keep]
+        polygon_lengths = np.bincount(ring_polygon[ring_keep], minlength=len(exterior))[polygon_keep]
+        feature_lengths = np.bincount(polygon_feature[polygon_keep], minlength=self.n_)
+
+        return geometry_index(self.coords_[keep],
+                              _offsets(ring_lengths),
+                              _offsets(polygon_lengths),
+                              _offsets(feature_lengths),
+                              np.where(feature_lengths > 0, self.types_, OTHER).astype(np.uint8))
+
+class geometry_builder():
+    """Builds a geometry index one geometry at a time. The coordinates of each geometry are converted to a NumPy array
+    as soon as it is added, so the geometries do not have to be held in memory as nested lists all at once.
+
+    """
+
+    def __init__(self):
+        self.coords_ = []
+        self.ring_lengths_ = []
+        self.polygon_lengths_ = []
+        self.feature_lengths_ = []
+        self.types_ = []
+
+    def add(self, geometry):
+        """Add a geojson geometry dictionary as the next feature."""
+        geometry_type = geometry['type'] if geometry else None
+
+        if geometry_type == 'Polygon':
+            polygons = [geometry['coordinates']]
+        elif geometry_type == 'MultiPolygon':
+            polygons = geometry['coordinates']
+        else:
+            polygons = []
+        polygons = [[ring for ring in polygon if ring] for polygon in polygons]
+        polygons = [polygon for polygon in polygons if polygon]
+        self.types_.append(geometry_type_codes.get(geometry_type, OTHER) if polygons else OTHER)
+
+        vertices = []
+        for polygon in polygons:
+            for ring in polygon:
+                vertices.extend(ring)
+                self.ring_lengths_.append(len(ring))
+            self.polygon_lengths_.append(len(polygon))
+        self.feature_lengths_.append(len(polygons))
+
+        if vertices:
+            coords = np.array(vertices, dtype=float)
+            if coords.ndim != 2:
+                #vertices with an altitude on some positions only
+                coords = np.array([vertex[:2] for vertex in vertices], dtype=float)
+            self.coords_.append(coords[:, :2])
+
+    def build(self):
+        """Return the geometry index of the geometries added so far."""
+        return geometry_index(np.concatenate(self.coords_) if self.coords_ else np.empty((0, 2)),
+                              _offsets(self.ring_lengths_),
+                              _offsets(self.polygon_lengths_),
+                              _offsets(self.feature_lengths_),
+                              np.array(self.types_, dtype=np.uint8))
+
+def pixel_tolerance(pixels, zoom, lat=0):
+    """Return the tolerance in degrees that corresponds to a number of pixels on a Mapbox map (512 pixel tiles) displayed
+    at the zoom level zoom around the latitude lat.
+
+    """
+    return pixels*360/(512*2**zoom)*np.cos(np.radians(lat))
+
+def _first_argmax(values, groups):
+    """Return the distinct groups and, for each of them, the index of the first largest value. The groups must be sorted,
+    i.e. the values of a group are contiguous.
+
+    """
+    if not len(values):
+        return groups[:0], np.zeros(0, dtype=np.int64)
+    boundaries = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    maxima = np.maximum.reduceat(values, boundaries)
+    candidates = np.flatnonzero(values == np.repeat(maxima, np.diff(np.r_[boundaries, len(values)])))
+    first = candidates[np.r_[True, groups[candidates[1:]] != groups[candidates[:-1]]]]
+    return groups[boundaries], first
+
+def _offsets(lengths):
+    """Return the offsets, the cumulative sum of lengths starting at 0."""
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
@@ -0,0 +1,121 @@
+"""The join module of choropleth_geojson. It aligns the rows of a pandas dataframe with the subregions of a geojson file.
+The keys on both sides are normalized by a pluggable normalizer (case, whitespace, unicode folding and aliases), and the
+alignment is a hashed pandas reindex, so that joining a large number of rows does not involve any quadratic step.
+pandas is imported by the functions that use it, not with the package.
+"""
+
+import numpy as np
+
+class key_normalizer():
+    """The default normalizer of the subregion names. It is called with a sequence of keys and returns a pandas Index
+    of normalized string keys. Any other callable with the same behavior can be used in its place.
+
+    """
+
+    def __init__(self, lower=True, strip=True, collapse_whitespace=False, fold_unicode=False, aliases=None):
+        """
+        Parameters
+        ----------
+        lower : bool
+            (Default: True)
+            Compare the keys case-insensitively.
+
+        strip : bool
+            (Default: True)
+            Ignore leading and trailing whitespace.
+
+        collapse_whitespace : bool
+            (Default: False)
+            Treat any run of whitespace inside a key as a single space.
+
+        fold_unicode : bool
+            (Default: False)
+            Compare the keys without accents and other diacritics, e.g. 'Curaçao' and 'Curacao' are the same key.
+
+        aliases : dict
+            (Default: None)
+            Alternative names mapped to the name they stand for, e.g. {'USA': 'United States'}. Both the alternative
+            names and the names they stand for are normalized with the other options before being compared.
+
+        """
+        self.lower_ = lower
+        self.strip_ = strip
+        self.collapse_whitespace_ = collapse_whitespace
+        self.fold_unicode_ = fold_unicode
+        self.aliases_ = None
+
+        if aliases:
+            import pandas as pd
+            aliases = pd.Series(self.normalize(list(aliases.values())).values, index=self.normalize(list(aliases.keys())))
+            self.aliases_ = aliases[~aliases.index.duplicated()]
+
+    def __call__(self, keys):
+        keys = self.normalize(keys)
+        if self.aliases_ is not None:
+            import pandas as pd
+            positions = self.aliases_.index.get_indexer(keys)
+            keys = pd.Index(np.where(positions >= 0, self.aliases_.values[positions], keys.values), dtype=object)
+        return keys
+
+    def normalize(self, keys):
+        """Apply the case, whitespace and unicode options to keys (without the aliases)."""
+        import pandas as pd
+        keys = pd.Index(keys, dtype=object).astype(str)
+        if self.fold_unicode_:
+            keys = keys.str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+        if self.collapse_whitespace_:
+            keys = keys.str.replace(r'\s+', ' ', regex=True)
+        if self.strip_:
+            keys = keys.str.strip()
+        if self.lower_:
+            keys = keys.str.lower()
+        return pd.Index(keys, dtype=object)
+
+class region_join():
+    """The hashed lookup from the normalized subregion names of a geojson file, built once and used to align any number
+    of dataframes with the subregions.
+
+    """
+
+    def __init__(self, labels, normalize=None):
+        """
+        Parameters
+        ----------
+        labels : list
+            The names of the subregions, in the order of the features of the geojson file.
+
+        normalize : callable
+            (Default: None, a key_normalizer() with the default options)
+            Called with a sequence of keys and returns a pandas Index of the normalized keys.
+
+        """
+        import pandas as pd
+        self.labels_ = pd.Index(labels)
+        self.normalize_ = normalize if normalize is not None else key_normalizer()
+        self.keys_ = pd.Index(self.normalize_(labels))
+
+    def align(self, df):
+        """Return the rows of df aligned with the subregions, indexed by the subregion names, and a report of the keys
+        that could not be matched. Subregions without a row get NaN. When several rows of df normalize to the same
+        key, the first one is used. df itself is left untouched.
+
+        The report is a dictionary with the lists unmatched_data (index entries of df without a subregion),
+        unmatched_regions (subregions without a row of df) and duplicated_data (index entries of df that were ignored
+        because an earlier row has the same key).
+
+        """
+        import pandas as pd
+        df_keys = pd.Index(self.normalize_(df.index))
+        first = ~df_keys.duplicated()
+
+        data = df[first]
+        data = data.set_axis(df_keys[first], axis=0)
+        positions = data.index.get_indexer(self.keys_)
+
+        aligned = data.reindex(self.keys_)
+        aligned.index = self.labels_
+
+        report = dict(unmatched_data=df.index[first & ~df_keys.isin(self.keys_)].tolist(),
+                      unmatched_regions=self.labels_[positions < 0].tolist(),
+                      duplicated_data=df.index[~first].tolist())
+        return aligned, report
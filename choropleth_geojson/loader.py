@@ -0,0 +1,168 @@
+"""The loader module of choropleth_geojson. It reads the features of a geojson file one at a time, without parsing the
+whole file into a dictionary, and compiles them into a geometry index. The compiled geometry can be kept in a cache
+directory as memory-mappable .npy files, so that the following loads of an unchanged file take no parsing at all.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from .geometry import geometry_builder, geometry_index
+
+#the start of the features array of a FeatureCollection
+_features_pattern = re.compile(r'"features"\s*:\s*\[')
+_whitespace = ' \t\r\n\x1e,'
+
+def iter_features(path, chunk_size=1 << 20):
+    """Yield the features of a geojson file one at a time. The file is either a FeatureCollection, in which case the
+    members of its features array are decoded one by one as the file is read, or a newline-delimited file with one
+    Feature per line (GeoJSON Text Sequences, whose records start with the RS character, are also accepted).
+
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        #read until the first line is complete, or the features array of a FeatureCollection is found
+        buffer = f.read(chunk_size)
+        while '\n' not in buffer.lstrip(_whitespace) and not _features_pattern.search(buffer):
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buffer += chunk
+
+        first_line = buffer.lstrip(_whitespace).split('\n', 1)[0]
+        match = _features_pattern.search(buffer)
+        if (match is None or match.start() > len(first_line)) and _is_feature(first_line):
+            yield from _iter_lines(buffer, f, chunk_size)
+        else:
+            yield from _iter_collection(buffer, f, chunk_size)
+
+def _is_feature(line):
+    """Return True if line is a complete JSON Feature object, i.e. the file is newline-delimited."""
+    try:
+        item = json.loads(line)
+    except ValueError:
+        return False
+    return isinstance(item, dict) and item.get('type') == 'Feature'
+
+def _iter_lines(buffer, f, chunk_size):
+    """Yield the features of a newline-delimited file."""
+    while True:
+        lines = buffer.split('\n')
+        buffer = lines.pop()
+        for line in lines:
+            line = line.strip(_whitespace)
+            if line:
+                yield json.loads(line)
+
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+
+    buffer = buffer.strip(_whitespace)
+    if buffer:
+        yield json.loads(buffer)
+
+def _iter_collection(buffer, f, chunk_size):
+    """Yield the members of the features array of a FeatureCollection."""
+    decoder = json.JSONDecoder()
+
+    match = _features_pattern.search(buffer)
+    while match is None:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            raise ValueError('no features array found in the geojson file')
+        #keep the end of the buffer in case the pattern is split between two chunks
+        buffer = buffer[-64:] + chunk
+        match = _features_pattern.search(buffer)
+    position = match.end()
+    read_size = chunk_size
+
+    while True:
+        while position < len(buffer) and buffer[position] in _whitespace:
+            position += 1
+
+        if position < len(buffer) and buffer[position] == ']':
+            return
+
+        try:
+            if position >= len(buffer):
+                raise ValueError('incomplete feature')
+            feature, end = decoder.raw_decode(buffer, position)
+        except ValueError:
+            #the feature is not complete yet, read more (doubling the read size for very large features)
+            chunk = f.read(read_size)
+            if not chunk:
+                raise
+            buffer = buffer[position:] + chunk
+            position = 0
+            read_size *= 2
+            continue
+
+        yield feature
+        position = end
+        read_size = chunk_size
+
+def default_cache_dir():
+    """Return the default cache directory, given by the environment variable CHOROPLETH_GEOJSON_CACHE or
+    ~/.cache/choropleth_geojson otherwise.
+
+    """
+    return os.environ.get('CHOROPLETH_GEOJSON_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'choropleth_geojson'))
+
+def cache_key(path):
+    """Return the cache key of a geojson file, a hash of its absolute path, size and modification time."""
+    stat = os.stat(path)
+    source = '{}|{}|{}'.format(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+def load_geometry(path, cache=True, cache_dir=None):
+    """Return the geometry index and the list of the properties of the features of a geojson file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the geojson file, a FeatureCollection or a newline-delimited file of Features.
+
+    cache : bool
+        (Default: True)
+        Keep the compiled geometry in the cache directory. If the file was already compiled and has not changed since,
+        the geometry is memory-mapped from the cache instead of being parsed again.
+
+    cache_dir : str
+        (Default: None, see default_cache_dir())
+        The cache directory.
+
+    """
+    if not cache:
+        return _parse(path)
+
+    directory = os.path.join(cache_dir or default_cache_dir(), cache_key(path))
+    if os.path.exists(os.path.join(directory, 'properties.json')):
+        with open(os.path.join(directory, 'properties.json'), 'r', encoding='utf-8') as f:
+            properties = json.load(f)
+        return geometry_index.load(directory), properties
+
+    index, properties = _parse(path)
+
+    #write to a temporary directory first, so that a concurrent reader never sees a partial cache entry
+    temporary = '{}.tmp-{}'.format(directory, os.getpid())
+    index.save(temporary)
+    with open(os.path.join(temporary, 'properties.json'), 'w', encoding='utf-8') as f:
+        json.dump(properties, f)
+    try:
+        os.replace(temporary, directory)
+    except OSError:
+        #another process wrote the same entry in the meantime
+        shutil.rmtree(temporary, ignore_errors=True)
+
+    return geometry_index.load(directory), properties
+
+def _parse(path):
+    """Parse the geojson file feature by feature into a geometry index and the list of the properties."""
+    builder = geometry_builder()
+    properties = []
+    for feature in iter_features(path):
+        builder.add(feature.get('geometry'))
+        properties.append(feature.get('properties') or {})
+    return builder.build(), properties
@@ -0,0 +1,92 @@
+"""The profiler module of choropleth_geojson. It records the wall time and the memory of the stages of choroplot() (the
+join, the geometry processing, the colors, the hover texts, the assembly of the traces and layers and the serialization
+of the figures) and counts of what was built, as a report that can be inspected or sent to a metrics pipeline.
+"""
+
+import time
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+
+class stage_profiler():
+    """Records the wall time, and optionally the memory, of named stages and a set of counts. Stages can be nested, the
+    time of a stage excludes the time of the stages nested in it, and a stage entered several times is accumulated.
+
+    """
+
+    def __init__(self, memory=True):
+        """
+        Parameters
+        ----------
+        memory : bool
+            (Default: True)
+            Record the memory allocated by each stage with tracemalloc. Tracing the allocations slows the stages down,
+            so the times are more accurate without it.
+
+        """
+        self.memory_ = memory
+        self.stages_ = OrderedDict()
+        self.counts_ = OrderedDict()
+        self.stack_ = []
+        self.tracing_ = False
+        self.start_ = None
+        self.seconds_ = None
+
+    def start(self):
+        """Start the profile (and tracemalloc, unless it is already tracing)."""
+        if self.memory_ and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.tracing_ = True
+        self.start_ = time.perf_counter()
+
+    def stop(self):
+        """Stop the profile (and tracemalloc, if it was started by start())."""
+        self.seconds_ = time.perf_counter() - self.start_
+        if self.tracing_:
+            tracemalloc.stop()
+            self.tracing_ = False
+
+    @contextmanager
+    def stage(self, name):
+        """Record the code run in the with block as the stage name."""
+        record = self.stages_.setdefault(name, dict(calls=0, seconds=0.0, allocated=0, peak=0))
+        memory = 0
+        if self.memory_:
+            memory, peak = tracemalloc.get_traced_memory()
+            #the peak of the enclosing stage so far, before the peak is reset for this stage
+            if self.stack_:
+                self.stack_[-1]['peak'] = max(self.stack_[-1]['peak'], peak)
+            tracemalloc.reset_peak()
+
+        entry = dict(start=time.perf_counter(), memory=memory, peak=memory, children=0.0)
+        self.stack_.append(entry)
+        try:
+            yield
+        finally:
+            self.stack_.pop()
+            seconds = time.perf_counter() - entry['start']
+            record['calls'] += 1
+            record['seconds'] += seconds - entry['children']
+
+            if self.memory_:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, entry['peak'])
+                record['allocated'] += current - entry['memory']
+                record['peak'] = max(record['peak'], peak - entry['memory'])
+            if self.stack_:
+                self.stack_[-1]['children'] += seconds
+                if self.memory_:
+                    self.stack_[-1]['peak'] = max(self.stack_[-1]['peak'], peak)
+
+    def count(self, name, value):
+        """Add value to the count name."""
+        self.counts_[name] = self.counts_.get(name, 0) + value
+
+    def report(self):
+        """Return the profile as a dictionary with the entries seconds (the total wall time), stages (a dictionary with
+        the calls, seconds, allocated and peak bytes of each stage, the bytes are 0 without memory) and counts.
+
+        """
+        return dict(seconds=self.seconds_,
+                    stages={name: dict(record) for name, record in self.stages_.items()},
+                    counts=dict(self.counts_))
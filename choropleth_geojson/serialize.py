@@ -0,0 +1,134 @@
+"""The serialize module of choropleth_geojson. It writes the figure dictionaries built by choroplot() to JSON and to
+standalone HTML files directly, without the validation and the conversion of plotly's figure objects, which the figures
+do not need since they are built by the package itself. The JSON is encoded by orjson when it is installed, and by the
+json module of the standard library otherwise, with numpy arrays and scalars encoded natively in both cases.
+"""
+
+import json
+import math
+import os
+import uuid
+import webbrowser
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_cdn_url = 'https://cdn.plot.ly/plotly-{}.min.js'
+
+def _default(obj):
+    """Encode the objects the JSON encoders do not know, numpy arrays and scalars and pandas timestamps."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
+
+def _replace_nan(obj):
+    """Return a copy of obj with the NaN and infinite floats replaced by None, which JSON has no literals for."""
+    if isinstance(obj, dict):
+        return {key: _replace_nan(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_nan(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _replace_nan(obj.tolist())
+    if isinstance(obj, (float, np.floating)) and not math.isfinite(obj):
+        return None
+    return obj
+
+def dumps(obj):
+    """Return obj encoded as a compact JSON string, with NaN encoded as null."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    try:
+        return json.dumps(obj, default=_default, separators=(',', ':'), allow_nan=False)
+    except ValueError:
+        #NaN or infinity somewhere in obj, only then is the whole figure walked
+        return json.dumps(_replace_nan(obj), default=_default, separators=(',', ':'), allow_nan=False)
+
+def dumps_html(obj):
+    """Return obj encoded as dumps does, to be written inside the script element of an HTML file."""
+    #'</' would end the script element inside a JSON string, '<\/' is the same string in javascript
+    return dumps(obj).replace('</', '<\\/')
+
+def to_json(fig):
+    """Return the figure dictionary fig as a JSON string."""
+    return dumps(fig)
+
+def write_json(fig, path):
+    """Write the figure dictionary fig to path as JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps(fig))
+
+def write_html(fig, path, include_plotlyjs='cdn', config=None, auto_open=False):
+    """Write the figure dictionary fig to path as a standalone HTML file that draws it with plotly.js.
+
+    Parameters
+    ----------
+    fig : dict
+        The figure dictionary, with the data, layout and (optionally) frames entries.
+
+    path : str
+        The path of the HTML file.
+
+    include_plotlyjs : bool or str
+        (Default: 'cdn')
+        How plotly.js is included. 'cdn' loads it from the plotly CDN (the version bundled with the installed plotly
+        package), True embeds the whole library in the file (about 3 MB), False leaves it out, e.g. when the file is
+        embedded in a page that already loads plotly.js.
+
+    config : dict
+        (Default: None, {'responsive': True})
+        The plotly.js configuration of the plot.
+
+    auto_open : bool
+        (Default: False)
+        Open the file in the web browser once it is written.
+
+    """
+    figure = dict(data=fig.get('data', []), layout=fig.get('layout', {}), config={'responsive': True} if config is None else config)
+    if fig.get('frames'):
+        figure['frames'] = fig['frames']
+    figure = dumps_html(figure)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        write_html_head(f, fig.get('layout', {}), include_plotlyjs)
+        f.write(figure)
+        write_html_tail(f)
+
+    if auto_open:
+        webbrowser.open('file://' + os.path.abspath(path))
+
+def write_html_head(f, layout, include_plotlyjs='cdn'):
+    """Write the start of the HTML file of write_html to the file object f, up to the figure argument of Plotly.newPlot,
+    so that the figure can be written in pieces (see the streaming module). layout gives the size of the plot.
+
+    """
+    div_id = str(uuid.uuid4())
+    width = '{}px'.format(layout['width']) if 'width' in layout else '100%'
+    height = '{}px'.format(layout['height']) if 'height' in layout else '100%'
+
+    f.write('<html>\n<head><meta charset="utf-8" /></head>\n<body>\n')
+    if include_plotlyjs == 'cdn':
+        from plotly.offline import get_plotlyjs_version
+        f.write('<script src="{}" charset="utf-8"></script>\n'.format(_cdn_url.format(get_plotlyjs_version())))
+    elif include_plotlyjs:
+        from plotly.offline import get_plotlyjs
+        f.write('<script type="text/javascript">')
+        f.write(get_plotlyjs())
+        f.write('</script>\n')
+
+    f.write('<div id="{}" class="plotly-graph-div" style="height:{}; width:{};"></div>\n'.format(div_id, height, width))
+    f.write('<script type="text/javascript">\n')
+    f.write('Plotly.newPlot("{}", '.format(div_id))
+
+def write_html_tail(f):
+    """Write the end of the HTML file of write_html to the file object f, after the figure (see write_html_head)."""
+    f.write(');\n</script>\n</body>\n</html>\n')
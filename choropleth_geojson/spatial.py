@@ -0,0 +1,129 @@
+"""The spatial module of choropleth_geojson. It indexes the bounding boxes of the subregions in a regular grid, kept as
+flat arrays in the same offsets layout as the geometry index, to find the subregions that intersect a viewport without
+testing every one of them, and it fits the center and the zoom of a Mapbox map to a bounding box.
+"""
+
+import numpy as np
+from .geometry import _offsets
+
+#the latitudes beyond which the Web Mercator projection of Mapbox does not extend
+max_lat = 85.0511287798
+
+class grid_index():
+    """A regular grid over the bounding boxes of the subregions. The subregions whose bounding box overlaps cell c are
+    items_[cell_offsets_[c]:cell_offsets_[c+1]], the cells being numbered row by row from the south west corner of the
+    extent of the subregions.
+
+    """
+
+    def __init__(self, bounds, cells=None):
+        """
+        Parameters
+        ----------
+        bounds : numpy array of shape (number of subregions, 4)
+            The west, south, east and north edges in degrees of the bounding box of each subregion, NaN for the
+            subregions without geometry (see geometry_index.bounds), which are never found.
+
+        cells : int
+            (Default: None (about one cell per subregion))
+            The approximate number of cells of the grid.
+
+        """
+        self.bounds_ = np.asarray(bounds, dtype=float).reshape(-1, 4)
+        self.extent_ = extent(self.bounds_)
+        valid = np.flatnonzero(~np.isnan(self.bounds_).any(axis=1))
+        cells = max(len(valid), 1) if cells is None else max(int(cells), 1)
+
+        if self.extent_ is None:
+            self.origin_, self.cell_size_, self.shape_ = (0.0, 0.0), (1.0, 1.0), (1, 1)
+            self.items_ = np.zeros(0, dtype=np.int64)
+            self.cell_offsets_ = np.zeros(2, dtype=np.int64)
+            return
+
+        #cells about as wide as they are high, in degrees
+        west, south, east, north = self.extent_
+        width, height = max(east - west, 1e-9), max(north - south, 1e-9)
+        nx = int(np.clip(np.round(np.sqrt(cells*width/height)), 1, cells))
+        ny = int(max(np.ceil(cells/nx), 1))
+        self.origin_ = (west, south)
+        self.cell_size_ = (width/nx, height/ny)
+        self.shape_ = (ny, nx)
+
+        #every subregion is listed in each cell its bounding box overlaps
+        x0, y0, x1, y1 = self._cells(self.bounds_[valid])
+        spans = x1 - x0 + 1
+        counts = spans*(y1 - y0 + 1)
+        within = np.arange(counts.sum()) - np.repeat(_offsets(counts)[:-1], counts)
+        spans = np.repeat(spans, counts)
+        cell = (np.repeat(y0, counts) + within//spans)*nx + np.repeat(x0, counts) + within % spans
+
+        order = np.argsort(cell, kind='stable')
+        self.items_ = np.repeat(valid, counts)[order]
+        self.cell_offsets_ = _offsets(np.bincount(cell, minlength=nx*ny))
+
+    def _cells(self, boxes):
+        """Return the first and the last column and row of the cells that the boxes (rows of west, south, east, north)
+        overlap, clipped to the grid.
+
+        """
+        ny, nx = self.shape_
+        columns = np.floor((boxes[:, [0, 2]] - self.origin_[0])/self.cell_size_[0]).astype(np.int64)
+        rows = np.floor((boxes[:, [1, 3]] - self.origin_[1])/self.cell_size_[1]).astype(np.int64)
+        columns, rows = np.clip(columns, 0, nx - 1), np.clip(rows, 0, ny - 1)
+        return columns[:, 0], rows[:, 0], columns[:, 1], rows[:, 1]
+
+    def query(self, west, south, east, north):
+        """Return the sorted indices of the subregions whose bounding box intersects the box west, south, east, north
+        (in degrees). A box whose west edge is greater than its east edge crosses the antimeridian, the west and east edges
+        are clipped to -180 and 180.
+
+        """
+        west, east = min(max(west, -180), 180), min(max(east, -180), 180)
+        if west > east:
+            return np.union1d(self.query(west, south, 180, north), self.query(-180, south, east, north))
+        if self.extent_ is None or south > north:
+            return np.zeros(0, dtype=np.int64)
+
+        x0, y0, x1, y1 = [value[0] for value in self._cells(np.array([[west, south, east, north]], dtype=float))]
+        cells = (np.arange(y0, y1 + 1)[:, None]*self.shape_[1] + np.arange(x0, x1 + 1)).ravel()
+        starts = self.cell_offsets_[cells]
+        lengths = self.cell_offsets_[cells + 1] - starts
+        positions = np.repeat(starts - _offsets(lengths)[:-1], lengths) + np.arange(lengths.sum())
+        candidates = np.unique(self.items_[positions])
+
+        #the cells only narrow the candidates down, the bounding boxes decide
+        boxes = self.bounds_[candidates]
+        hit = (boxes[:, 0] <= east) & (boxes[:, 2] >= west) & (boxes[:, 1] <= north) & (boxes[:, 3] >= south)
+        return candidates[hit]
+
+def extent(bounds):
+    """Return the bounding box (west, south, east, north) of all the bounding boxes in bounds, ignoring the rows with
+    NaN, or None if there are none.
+
+    """
+    bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+    bounds = bounds[~np.isnan(bounds).any(axis=1)]
+    if not len(bounds):
+        return None
+    return (float(bounds[:, 0].min()), float(bounds[:, 1].min()), float(bounds[:, 2].max()), float(bounds[:, 3].max()))
+
+def fit_view(box, width=1000, height=800, padding=0.1, max_zoom=20):
+    """Return the latitude, the longitude and the zoom of a Mapbox map of width x height pixels (512 pixel tiles, Web
+    Mercator projection) that is centered on the bounding box box (west, south, east, north) and shows all of it, with
+    a margin of padding (a fraction of the size of the map) around it. A box of a single point gets max_zoom.
+
+    """
+    west, south, east, north = box
+    south, north = np.clip([south, north], -max_lat, max_lat)
+    y_south, y_north = [np.log(np.tan(np.pi/4 + np.radians(lat)/2)) for lat in (south, north)]
+
+    lon = (west + east)/2
+    lat = np.degrees(2*np.arctan(np.exp((y_south + y_north)/2)) - np.pi/2)
+
+    #at zoom z the 360 degrees of longitude, or the 2 pi of the projected latitude, span 512*2**z pixels
+    zooms = [max_zoom]
+    if east > west:
+        zooms.append(np.log2(width*(1 - padding)*360/(512*(east - west))))
+    if y_north > y_south:
+        zooms.append(np.log2(height*(1 - padding)*2*np.pi/(512*(y_north - y_south))))
+    return float(lat), float(lon), float(np.clip(min(zooms), 0, max_zoom))
@@ -0,0 +1,204 @@
+"""The streaming module of choropleth_geojson. It plots a geojson file that is too large to be held in memory as a
+dictionary: the features are read one chunk at a time, the features whose subregion has no row in the dataframe are
+dropped, the others are simplified, quantized and encoded, and the encoded pieces are written out right away, so the
+memory used does not depend on the size of the file. The per-subregion arrays of the figure (locations, values and hover
+texts) are written to temporary files as they are produced and copied into the output at the end.
+"""
+
+import tempfile
+import numpy as np
+from .geometry import geometry_index, pixel_tolerance
+from .join import key_normalizer
+from .loader import iter_features
+from .serialize import dumps, dumps_html, write_html_head, write_html_tail
+
+class _fragments():
+    """The items of a JSON array, encoded and written to a temporary file as they are added."""
+
+    def __init__(self):
+        self.file_ = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self.count_ = 0
+
+    def extend(self, encoded, count):
+        """Add count items, encoded as a comma-separated string."""
+        if not count:
+            return
+        if self.count_:
+            self.file_.write(',')
+        self.file_.write(encoded)
+        self.count_ += count
+
+    def copy_to(self, f, chunk_size=1 << 20):
+        """Write the items to the file object f."""
+        self.file_.seek(0)
+        while True:
+            chunk = self.file_.read(chunk_size)
+            if not chunk:
+                break
+            f.write(chunk)
+
+    def close(self):
+        self.file_.close()
+
+def _chunks(iterable, size):
+    """Yield the items of iterable in lists of size items."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def stream_figure(apikey, path, df, glabel, output, col_str='', normalize=None, cmap='coolwarm', ptitle='', ctitle='', \
+                  lat=0, lon=0, zoom=0, opacity=1, missing_label='No data', missing_color='0.5', round_=None, scale=1, \
+                  ticks='outside', nstops=32, simplify=None, simplify_px=None, precision=None, include_plotlyjs='cdn', \
+                  chunk_size=1000, **kwargs):
+    """Plot the data of a column of df on the subregions of the geojson file at path and write the figure to output,
+    without loading the geojson file into memory. The figure is the one of choroplot(mode='trace'): a choroplethmapbox
+    trace with the subregions with data and a second trace, in missing_color, with the subregions whose data is missing.
+    The subregions without a row in df are left out of the figure.
+
+    Parameters
+    ----------
+    apikey : str
+        The Mapbox API key of the figure (see choropleth).
+
+    path : str
+        The path of the geojson file, a FeatureCollection or a newline-delimited file of Features (see iter_features).
+
+    df : pandas_dataframe object
+        The pandas dataframe that supplies the data for each subregion.
+
+    glabel : str
+        The label of the subregion in the properties of the features.
+
+    output : str
+        The path of the output file, a .json file with the figure dictionary or an .html file (see write_html).
+
+    normalize : callable
+        (Default: None, a key_normalizer() with the default options)
+        How the index of df and the subregion labels are normalized before they are matched (see choropleth).
+
+    simplify, simplify_px, precision
+        (Default: None)
+        The simplification and quantization of the subregions (see choroplot), applied to each chunk of features.
+
+    include_plotlyjs : bool or str
+        (Default: 'cdn')
+        How plotly.js is included in an html output (see write_html).
+
+    chunk_size : int
+        (Default: 1000)
+        The number of features read, processed and written at a time.
+
+    The other parameters are the ones of choroplot(), and kwargs are passed to the Mapbox layout dictionary.
+
+    """
+    """
+    Returns
+    -------
+    output: dict
+        A report with the number of features read, plotted (with data) and missing (without data), and the list
+        unmatched_data of the index entries of df without a subregion.
+
+    """
+    import pandas as pd
+    from . import choropleth
+
+    html = not output.lower().endswith('.json')
+    encode = dumps_html if html else dumps
+    tolerance = pixel_tolerance(simplify_px, zoom, lat) if simplify_px else simplify
+
+    normalize = normalize if normalize is not None else key_normalizer()
+    series = df[col_str] if col_str else df[df.columns[0]]
+    keys = pd.Index(normalize(df.index))
+    first = ~keys.duplicated()
+    lookup = pd.Index(keys[first])
+    values = np.asarray(series[first], dtype=float)
+    matched = np.zeros(len(lookup), dtype=bool)
+
+    names = ('features', 'locations', 'z', 'text', 'missing_features', 'missing_locations', 'missing_z', 'missing_text')
+    parts = {name: _fragments() for name in names}
+    read, zmin, zmax = 0, np.inf, -np.inf
+    try:
+        for chunk in _chunks(iter_features(path), chunk_size):
+            read += len(chunk)
+            labels = [(feature.get('properties') or {}).get(glabel) for feature in chunk]
+            positions = lookup.get_indexer(normalize(labels))
+            keep = np.flatnonzero(positions >= 0)
+            if not len(keep):
+                continue
+            matched[positions[keep]] = True
+
+            index = geometry_index.from_geometries([chunk[k].get('geometry') for k in keep])
+            if tolerance:
+                index = index.simplify(tolerance)
+            if precision is not None:
+                index = index.quantize(precision)
+            geometries = index.geometries()
+
+            chunk_labels = [labels[k] for k in keep]
+            chunk_values = pd.Series(values[positions[keep]], index=chunk_labels)
+            text = np.asarray(choropleth.get_hover_text(chunk_values, round_, scale, missing_label), dtype=object)
+            drawn = np.array([geometry is not None for geometry in geometries], dtype=bool)
+            has_data = drawn & chunk_values.notna().values
+
+            for prefix, rows in (('', has_data), ('missing_', drawn & ~has_data)):
+                rows = np.flatnonzero(rows)
+                if not len(rows):
+                    continue
+                features = [dict(type='Feature', properties={glabel: chunk_labels[k]}, geometry=geometries[k]) for k in rows]
+                parts[prefix + 'features'].extend(encode(features)[1:-1], len(rows))
+                parts[prefix + 'locations'].extend(encode([chunk_labels[k] for k in rows])[1:-1], len(rows))
+                parts[prefix + 'text'].extend(encode(text[rows].tolist())[1:-1], len(rows))
+                if prefix:
+                    parts['missing_z'].extend(','.join(['0']*len(rows)), len(rows))
+                else:
+                    chunk_z = chunk_values.values[rows]
+                    parts['z'].extend(encode(chunk_z.tolist())[1:-1], len(rows))
+                    zmin, zmax = min(zmin, chunk_z.min()), max(zmax, chunk_z.max())
+
+        if not parts['features'].count_:
+            zmin, zmax = 0.0, 0.0
+        _, colorscale = choropleth.get_color_info(pd.Series([zmin, zmax]), cmap, missing_color, nstops)
+        layout = choropleth.get_layout(ptitle, apikey, [], lat, lon, zoom, kwargs)
+        data_style, missing_style = choropleth.get_trace_styles(glabel, opacity, ctitle, ticks, missing_color)
+
+        with open(output, 'w', encoding='utf-8') as f:
+            if html:
+                write_html_head(f, layout, include_plotlyjs)
+            f.write('{"data":[')
+            _write_trace(f, encode, parts, '', dict(hoverinfo='text', zmin=float(zmin), zmax=float(zmax), colorscale=colorscale, **data_style))
+            if parts['missing_features'].count_:
+                f.write(',')
+                _write_trace(f, encode, parts, 'missing_', dict(hoverinfo='text', **missing_style))
+            f.write('],"layout":')
+            f.write(encode(layout))
+            if html:
+                f.write(',"config":{"responsive":true}}')
+                write_html_tail(f)
+            else:
+                f.write('}')
+    finally:
+        for part in parts.values():
+            part.close()
+
+    return dict(features=read, plotted=parts['features'].count_, missing=parts['missing_features'].count_,
+                unmatched_data=df.index[first][~matched].tolist())
+
+def _write_trace(f, encode, parts, prefix, attributes):
+    """Write a choroplethmapbox trace to the file object f, with the geojson, locations, z and text of the fragments of
+    parts whose names start with prefix, and the other attributes of the trace.
+
+    """
+    f.write('{"type":"choroplethmapbox","geojson":{"type":"FeatureCollection","features":[')
+    parts[prefix + 'features'].copy_to(f)
+    f.write(']}')
+    for name in ('locations', 'z', 'text'):
+        f.write(',"{}":['.format(name))
+        parts[prefix + name].copy_to(f)
+        f.write(']')
+    #the attributes close the trace object
+    f.write(',' + encode(attributes)[1:])
@@ -0,0 +1,80 @@
+"""Generate choropleth_geojson/_colormaps.py, the lookup tables of the matplotlib colormaps that choropleth_geojson
+maps the data with, so that plotting does not need to import matplotlib. Rerun it when a new matplotlib version adds or
+changes colormaps,
+
+    python scripts/make_colormaps.py
+
+Each table is the lookup table of the colormap in bytes, (colormap._lut*255).astype(np.uint8) as matplotlib computes
+the colors with bytes=True, without the under, over and bad entries, which are left at their defaults by the colormaps
+that are bundled. The rows are stored as their differences from the previous row (modulo 256), which zlib compresses
+well for smooth colormaps, and the reversed colormaps ('_r') as their exclusive or with the reversed table of the
+colormap they reverse, which is zero but for a few rounding differences.
+"""
+
+import base64
+import os
+import sys
+import zlib
+import matplotlib
+import numpy as np
+from matplotlib import colormaps
+
+output = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'choropleth_geojson', '_colormaps.py')
+
+def lookup_table(cmap):
+    """Return the lookup table of cmap in bytes, with the under, over and bad entries, or None if it has none."""
+    try:
+        cmap._init()
+    except (AttributeError, NotImplementedError):
+        return None
+    lut = getattr(cmap, '_lut', None)
+    if lut is None or lut.ndim != 2 or lut.shape[1] != 4:
+        return None
+    return (lut*255).astype(np.uint8)
+
+def has_default_extremes(lut, n):
+    """Return True if the under, over and bad colors of the table are the defaults of matplotlib."""
+    return (lut[n] == lut[0]).all() and (lut[n + 1] == lut[n - 1]).all() and (lut[n + 2] == 0).all()
+
+def encode(table):
+    return base64.b64encode(zlib.compress(np.ascontiguousarray(table).tobytes(), 9)).decode('ascii')
+
+def main():
+    tables, skipped = {}, []
+    for name in sorted(colormaps):
+        cmap = colormaps[name]
+        lut = lookup_table(cmap)
+        if lut is None or not has_default_extremes(lut, cmap.N):
+            skipped.append(name)
+            continue
+        tables[name] = lut[:cmap.N]
+
+    lines = ['"""The lookup tables of the matplotlib colormaps, generated by scripts/make_colormaps.py from matplotlib {}, do not edit.'.format(matplotlib.__version__),
+             'Each table is encoded as in that script and decoded by the colors module.',
+             '"""',
+             '',
+             "matplotlib_version = '{}'".format(matplotlib.__version__),
+             '',
+             '#the number of colors and the row differences of the lookup table of each colormap',
+             'tables = {']
+    reversed_lines = ['#the exclusive or of the reversed colormaps with the reversed table of the colormap they reverse',
+                      'reversed_tables = {']
+
+    for name, table in tables.items():
+        if name.endswith('_r') and name[:-2] in tables:
+            reversed_lines.append("    '{}': '{}',".format(name, encode(table ^ tables[name[:-2]][::-1])))
+        else:
+            deltas = np.diff(table, axis=0, prepend=np.zeros((1, 4), dtype=np.uint8))
+            lines.append("    '{}': ({}, '{}'),".format(name, len(table), encode(deltas)))
+
+    lines += ['}', ''] + reversed_lines + ['}', '']
+    with open(output, 'w') as f:
+        f.write('\n'.join(lines))
+
+    print('{} colormaps written to {}, {} bytes'.format(len(tables), output, os.path.getsize(output)))
+    if skipped:
+        print('skipped (no lookup table or custom under, over or bad colors): ' + ', '.join(skipped))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())